@@ -0,0 +1,105 @@
+"""
+Benchmark the shared pooled client against a per-call AsyncClient.
+
+Both sides issue the bare GET that hg_get makes, without its rate limiter, response
+cache and quota metering, so the run measures connection reuse only and leaves the
+quota database untouched. Runs a local stub HTTP server so no API key or network
+access is needed:
+
+    python benchmarks/bench_client.py --requests 500 --concurrency 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("HIGHER_GOV_API_KEY", "bench")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+import highergov_server as hs  # noqa: E402
+
+BODY = json.dumps({"meta": {"total_count": 1}, "results": [{"opp_key": "x", "title": "stub"}]}).encode()
+
+
+async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Answer every request on the connection with a fixed JSON body (HTTP/1.1 keep-alive)."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n" + BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def per_call_get(endpoint: str, params: dict) -> dict:
+    """The previous hg_get behaviour: a fresh client (and connection) per call."""
+    params = {k: v for k, v in params.items() if v is not None}
+    params["api_key"] = hs.HIGHERGOV_API_KEY
+    async with httpx.AsyncClient(timeout=30) as client:
+        r = await client.get(f"{hs.BASE_URL}/{endpoint}/", params=params)
+        r.raise_for_status()
+        return r.json()
+
+
+async def pooled_get(endpoint: str, params: dict) -> dict:
+    """The same request on the shared pooled client (hs.get_client())."""
+    params = {k: v for k, v in params.items() if v is not None}
+    params["api_key"] = hs.HIGHERGOV_API_KEY
+    r = await hs.get_client().get(f"{hs.BASE_URL}/{endpoint}/", params=params)
+    r.raise_for_status()
+    return r.json()
+
+
+async def run(fn, total: int, concurrency: int) -> list[float]:
+    """Issue `total` calls with bounded concurrency and return per-call latencies in ms."""
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(i: int) -> None:
+        async with sem:
+            start = time.perf_counter()
+            await fn("opportunity", {"page_number": i})
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{name:<12} n={len(latencies):<6} p50={p50:7.3f} ms  p99={p99:7.3f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    hs.BASE_URL = f"http://127.0.0.1:{port}"
+
+    async with server:
+        report("per-call", await run(per_call_get, args.requests, args.concurrency))
+        report("pooled", await run(pooled_get, args.requests, args.concurrency))
+        await hs.close_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
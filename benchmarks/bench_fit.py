@@ -0,0 +1,84 @@
+"""
+Check that fit_response holds responses to max_response_tokens on randomized pages.
+
+Builds synthetic opportunity pages (long, short, empty and null descriptions, text
+that JSON escaping lengthens) and random fields/max_chars/token budgets; no API key
+or network access is needed:
+
+    python benchmarks/bench_fit.py --cases 9000
+
+Prints how much of each budget the fitted responses use, and exits with status 1 if
+any response overruns its budget or an elided entry lacks its handle.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+os.environ.setdefault("HIGHER_GOV_API_KEY", "bench")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import highergov_server as hs  # noqa: E402
+
+FIELDS = (None, ["title", "description"], ["description"], ["opp_key", "description"], ["opp_key", "title"])
+
+
+def description(rng: random.Random) -> str | None:
+    kind = rng.random()
+    if kind < 0.25:
+        return None
+    if kind < 0.3:
+        return ""
+    return rng.choice(("Cloud migration. ", 'é "quoted"\n', "x")) * rng.randint(1, 1500)
+
+
+def page(rng: random.Random) -> list:
+    return [
+        hs.opportunity_record({
+            "opp_key": f"opp-{i}",
+            "title": "Title " * rng.randint(0, 15),
+            "description_text": description(rng),
+            "agency": {"agency_name": "Agency " * rng.randint(0, 5)},
+        })
+        for i in range(rng.randint(0, 50))
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=9000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    overruns = lost_handles = fitted = 0
+    worst = 0
+    usage = []
+    for _ in range(args.cases):
+        records = page(rng)
+        tokens = rng.randint(20, 8000)
+        max_chars = rng.choice((None, None, rng.randint(0, 600)))
+        response = {"total_count": 1000, "page": 1, "page_size": 25, "opportunities": records}
+        out = hs.fit_opportunities(response, rng.choice(FIELDS), max_chars, tokens)
+        budget = tokens * hs.CHARS_PER_TOKEN
+        size = len(json.dumps(out))
+        # With no record kept the response is as small as it gets, so it is not an overrun
+        if out["opportunities"]:
+            fitted += 1
+            usage.append(size / budget)
+            if size > budget:
+                overruns += 1
+                worst = max(worst, size - budget)
+        lost_handles += sum(entry["opp_key"] is None for entry in out.get("elided", {}).get("records", []))
+
+    usage.sort()
+    median = usage[len(usage) // 2] if usage else 0
+    print(f"cases={args.cases} fitted={fitted} overruns={overruns} worst_overrun={worst} chars")
+    print(f"budget used: median={median:.0%} max={max(usage, default=0):.0%}")
+    if overruns or lost_handles:
+        sys.exit(f"{overruns} responses over budget, {lost_handles} elided entries without a handle")
+
+
+if __name__ == "__main__":
+    main()
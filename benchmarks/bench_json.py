@@ -0,0 +1,65 @@
+"""
+Benchmark JSON decoders on 100-record API pages, alone and followed by projection.
+
+Uses recorded payloads when given a directory of saved API responses (*.json), and
+synthetic contract and awardee pages otherwise; no API key or network access is needed:
+
+    python benchmarks/bench_json.py --fixtures path/to/responses --pages 500
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import timeit
+
+os.environ.setdefault("HIGHER_GOV_API_KEY", "bench")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import highergov_server as hs  # noqa: E402
+from bench_records import awardee, contract  # noqa: E402
+
+DECODERS = {"json": json.loads}
+if hs.orjson is not None:
+    DECODERS["orjson"] = hs.orjson.loads
+if hs.msgspec is not None:
+    DECODERS["msgspec"] = hs.msgspec.json.decode
+
+
+def load_fixtures(directory: str | None) -> dict[str, bytes]:
+    """Recorded payloads by file name, or synthetic pages when no directory is given."""
+    if directory:
+        fixtures = {}
+        for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+            with open(path, "rb") as f:
+                fixtures[os.path.basename(path)] = f.read()
+        return fixtures
+    return {
+        name: json.dumps({"meta": {"total_count": 100}, "results": [make(i) for i in range(100)]}).encode()
+        for name, make in (("contract", contract), ("awardee", awardee))
+    }
+
+
+def per_page_us(fn, pages: int) -> float:
+    """Best-of-5 time per call, in microseconds."""
+    return min(timeit.repeat(fn, number=pages, repeat=5)) / pages * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixtures", help="Directory of recorded API responses (*.json)")
+    parser.add_argument("--pages", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"server decoder: {hs.decode_json.__module__}.{hs.decode_json.__name__}")
+    for name, payload in load_fixtures(args.fixtures).items():
+        record = hs.awardee_record if "awardee" in name else hs.contract_record
+        print(f"{name} ({len(payload) / 1024:.0f} KiB)")
+        for decoder, loads in DECODERS.items():
+            decode = per_page_us(lambda: loads(payload), args.pages)
+            both = per_page_us(lambda: [record(r) for r in loads(payload)["results"]], args.pages)
+            print(f"  {decoder:<8} decode={decode:8.1f} us/page  decode+project={both:8.1f} us/page")
+
+
+if __name__ == "__main__":
+    main()
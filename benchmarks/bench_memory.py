@@ -0,0 +1,89 @@
+"""
+Measure the memory held by 100k normalized records as record models and as plain dicts.
+
+Projects synthetic API records for each entity; no API key or network access is needed:
+
+    python benchmarks/bench_memory.py --records 100000
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("HIGHER_GOV_API_KEY", "bench")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import highergov_server as hs  # noqa: E402
+from bench_records import awardee, contract  # noqa: E402
+
+
+def opportunity(i: int) -> dict:
+    return {
+        "opp_key": f"O{i}",
+        "title": "Cloud migration support",
+        "description_text": "Seeking cloud migration and operations support.",
+        "agency": {"agency_key": 7, "agency_name": "General Services Administration"},
+        "source_type": "sam",
+        "posted_date": "2026-09-01",
+        "captured_date": "2026-09-01",
+        "due_date": "2026-11-01",
+        "naics_code": {"naics_code": "541512"},
+        "psc_code": {"psc_code": "D310"},
+        "pop_state": "VA",
+        "primary_contact_email": {"contact_name": "Pat Lee", "contact_email": "pat@example.gov"},
+        "path": f"/opportunity/{i}/",
+    }
+
+
+def grant(i: int) -> dict:
+    return {
+        "grant_key": f"G{i}",
+        "award_id": f"NSF{i:07d}",
+        "title": "Research infrastructure",
+        "awarding_agency": {"agency_key": 9, "agency_name": "National Science Foundation"},
+        "awardee": {"awardee_key": i, "clean_name": f"University {i}", "uei": f"UEI{i:09d}"},
+        "obligated_amount": 450000.0,
+        "cfda_program_number": "47.070",
+        "cfda_program_title": "Computer and Information Science and Engineering",
+        "place_of_performance_state": "MA",
+        "period_of_performance_start_date": "2025-09-01",
+        "period_of_performance_current_end_date": "2028-08-31",
+        "last_modified_date": "2026-10-01",
+        "path": f"/grant/{i}/",
+    }
+
+
+def retained_bytes(build) -> int:
+    """Bytes still allocated once `build()` returns, with its result kept alive."""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for name, make, record in (
+        ("opportunity", opportunity, hs.opportunity_record),
+        ("contract", contract, hs.contract_record),
+        ("grant", grant, hs.grant_record),
+        ("awardee", awardee, hs.awardee_record),
+    ):
+        raw = [make(i) for i in range(args.records)]
+        as_dict = retained_bytes(lambda: [hs.as_dict(record(r)) for r in raw])
+        model = retained_bytes(lambda: [record(r) for r in raw])
+        print(
+            f"{name:<12} dict={as_dict / 2**20:7.1f} MiB  model={model / 2**20:7.1f} MiB  "
+            f"saved={(as_dict - model) / 2**20:6.1f} MiB ({1 - model / as_dict:.0%}) per {args.records:,} records"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Benchmark the spec-built record projectors against the previous hand-written mappings.
+
+Transforms synthetic 100-record API pages; no API key or network access is needed:
+
+    python benchmarks/bench_records.py --pages 2000
+
+Exits with status 1 if a projector is not faster than the hand-written mapping.
+"""
+import argparse
+import os
+import sys
+import timeit
+
+os.environ.setdefault("HIGHER_GOV_API_KEY", "bench")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import highergov_server as hs  # noqa: E402
+
+
+def loop_awardee_record(a: dict) -> dict:
+    """The previous hand-written awardee mapping."""
+    primary_naics_obj = a.get("primary_naics") or {}
+    naics_list = a.get("naics_codes") or []
+    psc_list = a.get("psc_codes") or []
+    bus_type_info = a.get("bus_type_info") or []
+    parent = a.get("awardee_key_parent") or {}
+
+    # Extract certification info with SBA-certified flag
+    certifications = []
+    for bt in bus_type_info:
+        if isinstance(bt, dict):
+            certifications.append({
+                "type": bt.get("bus_type"),
+                "description": bt.get("bus_type_description"),
+                "sba_certified": bt.get("cert_flag", False),
+            })
+
+    return {
+        "awardee_key": a.get("awardee_key"),
+        "name": a.get("clean_name"),
+        "legal_name": a.get("legal_business_name"),
+        "dba_name": a.get("dba_name"),
+        "division_name": a.get("division_name"),
+        "cage_code": a.get("cage_code"),
+        "uei": a.get("uei"),
+        "address": {
+            "line1": a.get("physical_address_line_1"),
+            "line2": a.get("physical_address_line_2"),
+            "city": a.get("physical_address_city"),
+            "state": a.get("physical_address_province_or_state"),
+            "zip": a.get("physical_address_zip_postal_code"),
+            "country": a.get("physical_address_country_code"),
+        },
+        "website": a.get("website"),
+        "year_founded": a.get("year_founded"),
+        "employee_count": a.get("employee_count"),
+        "primary_naics": primary_naics_obj.get("naics_code") if isinstance(primary_naics_obj, dict) else primary_naics_obj,
+        "naics_codes": [n.get("naics_code") if isinstance(n, dict) else n for n in naics_list],
+        "psc_codes": [p.get("psc_code") if isinstance(p, dict) else p for p in psc_list],
+        "certifications": certifications,
+        "parent_company": {
+            "awardee_key": parent.get("awardee_key") if isinstance(parent, dict) else None,
+            "name": parent.get("clean_name") if isinstance(parent, dict) else None,
+        } if parent else None,
+        "registration": {
+            "status": a.get("purpose_of_registration"),
+            "initial_date": a.get("initial_registration_date"),
+            "expiration_date": a.get("registration_expiration_date"),
+            "last_update": a.get("registration_last_update_date"),
+            "sam_extract_code": a.get("sam_extract_code"),
+        },
+        "govt_poc": {
+            "name": f"{a.get('govt_bus_poc_first_name', '')} {a.get('govt_bus_poc_last_name', '')}".strip() or None,
+            "title": a.get("govt_bus_poc_title"),
+            "phone": a.get("govt_bus_poc_phone"),
+            "email": a.get("govt_bus_poc_email"),
+        },
+        "highergov_url": a.get("path"),
+    }
+
+
+def loop_contract_record(c: dict) -> dict:
+    """The previous hand-written contract mapping."""
+    awardee = c.get("awardee") or {}
+    agency = c.get("awarding_agency") or {}
+    naics = c.get("naics_code") or {}
+    psc = c.get("psc_code") or {}
+
+    return {
+        "contract_key": c.get("contract_key"),
+        "award_id": c.get("award_id"),
+        "title": c.get("title"),
+        "description": c.get("description"),
+        "awarding_agency": agency.get("agency_name"),
+        "awardee_name": awardee.get("clean_name"),
+        "awardee_uei": awardee.get("uei"),
+        "awardee_cage": awardee.get("cage_code"),
+        "obligated_amount": c.get("obligated_amount"),
+        "potential_value": c.get("potential_value"),
+        "base_and_all_options": c.get("base_and_all_options_value"),
+        "start_date": c.get("period_of_performance_start_date"),
+        "end_date": c.get("period_of_performance_current_end_date"),
+        "naics_code": naics.get("naics_code") if isinstance(naics, dict) else naics,
+        "psc_code": psc.get("psc_code") if isinstance(psc, dict) else psc,
+        "place_of_performance_state": c.get("place_of_performance_state"),
+        "contract_type": c.get("type_of_contract"),
+        "set_aside": c.get("type_of_set_aside"),
+        "last_modified_date": c.get("last_modified_date"),
+        "highergov_url": c.get("path"),
+    }
+
+
+def awardee(i: int) -> dict:
+    return {
+        "awardee_key": i,
+        "clean_name": f"Company {i}",
+        "legal_business_name": f"COMPANY {i} LLC",
+        "cage_code": f"{i:05d}",
+        "uei": f"UEI{i:09d}",
+        "physical_address_line_1": "1 Main St",
+        "physical_address_city": "Reston",
+        "physical_address_province_or_state": "VA",
+        "physical_address_zip_postal_code": "20190",
+        "physical_address_country_code": "USA",
+        "employee_count": 50,
+        "primary_naics": {"naics_code": "541512", "naics_title": "Computer Systems Design Services"},
+        "naics_codes": [{"naics_code": code} for code in ("541511", "541512", "541519", "518210")],
+        "psc_codes": [{"psc_code": code} for code in ("D310", "DA01")],
+        "bus_type_info": [
+            {"bus_type": "A6", "bus_type_description": "8(a) Program Participant", "cert_flag": True},
+            {"bus_type": "QF", "bus_type_description": "Service-Disabled Veteran-Owned", "cert_flag": False},
+        ],
+        "awardee_key_parent": {"awardee_key": 1, "clean_name": "Parent Co"},
+        "registration_last_update_date": "2026-01-15",
+        "govt_bus_poc_first_name": "Pat",
+        "govt_bus_poc_last_name": "Lee",
+        "path": f"/awardee/{i}/",
+    }
+
+
+def contract(i: int) -> dict:
+    return {
+        "contract_key": f"C{i}",
+        "award_id": f"47QTCA{i:06d}",
+        "title": "IT support services",
+        "awarding_agency": {"agency_key": 7, "agency_name": "General Services Administration"},
+        "awardee": {"awardee_key": i, "clean_name": f"Company {i}", "uei": f"UEI{i:09d}", "cage_code": "1ABC2"},
+        "obligated_amount": 125000.0,
+        "potential_value": 2500000.0,
+        "base_and_all_options_value": 2500000.0,
+        "period_of_performance_start_date": "2025-10-01",
+        "period_of_performance_current_end_date": "2027-09-30",
+        "naics_code": {"naics_code": "541512"},
+        "psc_code": {"psc_code": "D310"},
+        "last_modified_date": "2026-10-01",
+        "path": f"/contract/{i}/",
+    }
+
+
+def per_record_us(fns: list, page: list[dict], pages: int, sample_pages: int = 10) -> list[float]:
+    """Best time for each fn to transform one record, in microseconds.
+
+    The pages are timed in short samples, interleaved across the fns, so a burst of
+    background load skews one sample of each rather than one fn's whole run.
+    """
+    timers = [timeit.Timer(lambda fn=fn: [fn(r) for r in page]) for fn in fns]
+    samples = [[timer.timeit(sample_pages) for timer in timers] for _ in range(max(1, pages // sample_pages))]
+    return [min(times) / (sample_pages * len(page)) * 1e6 for times in zip(*samples)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+
+    slower = []
+    for name, make, loop, built in (
+        ("awardee", awardee, loop_awardee_record, hs.awardee_record),
+        ("contract", contract, loop_contract_record, hs.contract_record),
+    ):
+        page = [make(i) for i in range(100)]
+        assert [loop(r) for r in page] == [hs.as_dict(built(r)) for r in page]
+        before, after = per_record_us([loop, built], page, args.pages)
+        print(f"{name:<9} hand-written={before:6.2f} us/record  spec-built={after:6.2f} us/record  ({before / after:.2f}x)")
+        if after >= before:
+            slower.append(name)
+    if slower:
+        sys.exit(f"spec-built projectors are not faster for: {', '.join(slower)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,46 @@
+import asyncio
+import calendar
+import json
+import linecache
+import math
 import os
-from datetime import datetime, timedelta
+import random
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import make_dataclass
+from difflib import SequenceMatcher, get_close_matches
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
 import httpx
 from fastmcp import FastMCP
-
-mcp = FastMCP("highergov-mcp")
+from fastmcp.exceptions import ToolError
+from fastmcp.server.dependencies import get_context
+
+# Optional faster JSON decoders for upstream responses; the standard library is the fallback
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if msgspec is not None:
+    decode_json = msgspec.json.decode
+elif orjson is not None:
+    decode_json = orjson.loads
+else:
+    decode_json = json.loads
 
 HIGHERGOV_API_KEY = os.environ.get("HIGHER_GOV_API_KEY")
 if not HIGHERGOV_API_KEY:
@@ -11,15 +48,884 @@ if not HIGHERGOV_API_KEY:
 
 BASE_URL = "https://www.highergov.com/api-external"
 
+# Directory for persistent server state (usage totals, local indexes and mirrors)
+DATA_DIR = os.path.expanduser(os.environ.get("HIGHER_GOV_DATA_DIR", "~/.cache/highergov-mcp"))
+
+# Connection pool settings for the shared HTTP client
+HTTP_TIMEOUT = float(os.environ.get("HIGHER_GOV_HTTP_TIMEOUT", "30"))
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HIGHER_GOV_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("HIGHER_GOV_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("HIGHER_GOV_KEEPALIVE_EXPIRY", "30"))
+
+# Client-side pacing matching HigherGov's published limits
+RATE_LIMIT_PER_SECOND = int(os.environ.get("HIGHER_GOV_RATE_LIMIT_PER_SECOND", "10"))
+RATE_LIMIT_PER_DAY = int(os.environ.get("HIGHER_GOV_RATE_LIMIT_PER_DAY", "100000"))
+
+# Retry policy for transient upstream failures
+RETRY_MAX_ATTEMPTS = int(os.environ.get("HIGHER_GOV_RETRY_MAX_ATTEMPTS", "4"))
+RETRY_BACKOFF_BASE = float(os.environ.get("HIGHER_GOV_RETRY_BACKOFF_BASE", "0.5"))
+RETRY_BACKOFF_MAX = float(os.environ.get("HIGHER_GOV_RETRY_BACKOFF_MAX", "8"))
+RETRY_JITTER = float(os.environ.get("HIGHER_GOV_RETRY_JITTER", "0.5"))
+RETRY_DEADLINE = float(os.environ.get("HIGHER_GOV_RETRY_DEADLINE", "60"))
+RETRY_STATUSES = {
+    int(code) for code in os.environ.get("HIGHER_GOV_RETRY_STATUSES", "429,500,502,503,504").split(",") if code.strip()
+}
+
+# In-process response cache; TTLs follow each endpoint's upstream refresh cadence
+CACHE_MAX_BYTES = int(os.environ.get("HIGHER_GOV_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CACHE_TTLS = {
+    "opportunity": 30 * 60,
+    "document": 10 * 60,
+    "contract": 24 * 3600,
+    "grant": 24 * 3600,
+    "people": 24 * 3600,
+    "contract_vehicle": 24 * 3600,
+    "agency": 7 * 24 * 3600,
+    "awardee": 30 * 24 * 3600,
+    "naics": 90 * 24 * 3600,
+    "psc": 90 * 24 * 3600,
+}
+for _endpoint in CACHE_TTLS:
+    if f"HIGHER_GOV_CACHE_TTL_{_endpoint.upper()}" in os.environ:
+        CACHE_TTLS[_endpoint] = int(os.environ[f"HIGHER_GOV_CACHE_TTL_{_endpoint.upper()}"])
+
+# Optional on-disk cache shared by all server processes on the host
+DISK_CACHE_PATH = os.environ.get("HIGHER_GOV_DISK_CACHE_PATH")
+DISK_CACHE_MAX_BYTES = int(os.environ.get("HIGHER_GOV_DISK_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+DISK_CACHE_MAINTENANCE_INTERVAL = float(os.environ.get("HIGHER_GOV_DISK_CACHE_MAINTENANCE_INTERVAL", "300"))
+
+# Monthly record quota accounting; budgets of 0 disable enforcement
+QUOTA_DB_PATH = os.environ.get("HIGHER_GOV_QUOTA_DB_PATH", os.path.join(DATA_DIR, "quota.db"))
+MONTHLY_RECORD_BUDGET = int(os.environ.get("HIGHER_GOV_MONTHLY_RECORD_BUDGET", "0"))
+CALLER_RECORD_BUDGET = int(os.environ.get("HIGHER_GOV_CALLER_RECORD_BUDGET", "0"))
+BUDGET_MODE = os.environ.get("HIGHER_GOV_BUDGET_MODE", "downsize")
+
+# Server-side pagination for fetch_all requests
+PAGE_CONCURRENCY = int(os.environ.get("HIGHER_GOV_PAGE_CONCURRENCY", "4"))
+FETCH_ALL_MAX_RECORDS = int(os.environ.get("HIGHER_GOV_FETCH_ALL_MAX_RECORDS", "10000"))
+
+# Rough characters per LLM token, used to turn max_response_tokens into a size budget
+CHARS_PER_TOKEN = int(os.environ.get("HIGHER_GOV_CHARS_PER_TOKEN", "4"))
+
+# Batch entity lookups
+BATCH_CONCURRENCY = int(os.environ.get("HIGHER_GOV_BATCH_CONCURRENCY", "8"))
+BATCH_MAX_IDENTIFIERS = int(os.environ.get("HIGHER_GOV_BATCH_MAX_IDENTIFIERS", "500"))
+
+# Local opportunity store kept current by a background captured_date sync (0 disables the job)
+OPPORTUNITY_DB_PATH = os.environ.get("HIGHER_GOV_OPPORTUNITY_DB_PATH", os.path.join(DATA_DIR, "opportunities.db"))
+OPPORTUNITY_SYNC_INTERVAL = float(os.environ.get("HIGHER_GOV_OPPORTUNITY_SYNC_INTERVAL", "0"))
+OPPORTUNITY_SYNC_BACKFILL_DAYS = int(os.environ.get("HIGHER_GOV_OPPORTUNITY_SYNC_BACKFILL_DAYS", "7"))
+
+# Local award mirrors synced by last_modified_date for configured scopes (0 disables the job).
+# Scopes are comma-separated filter=value pairs, e.g. "naics_code=541512,awarding_agency_key=123"
+MIRROR_DB_PATH = os.environ.get("HIGHER_GOV_MIRROR_DB_PATH", os.path.join(DATA_DIR, "mirror.db"))
+MIRROR_SYNC_INTERVAL = float(os.environ.get("HIGHER_GOV_MIRROR_SYNC_INTERVAL", "0"))
+MIRROR_BACKFILL_DAYS = int(os.environ.get("HIGHER_GOV_MIRROR_BACKFILL_DAYS", "30"))
+MIRROR_MAX_RECORDS_PER_DAY = int(os.environ.get("HIGHER_GOV_MIRROR_MAX_RECORDS_PER_DAY", "10000"))
+CONTRACT_MIRROR_SCOPES = [
+    tuple(item.strip().split("=", 1))
+    for item in os.environ.get("HIGHER_GOV_CONTRACT_MIRROR_SCOPES", "").split(",")
+    if "=" in item
+]
+GRANT_MIRROR_CFDA_PROGRAMS = [
+    number.strip() for number in os.environ.get("HIGHER_GOV_GRANT_MIRROR_CFDA_PROGRAMS", "").split(",") if number.strip()
+]
+# "all" mirrors every SAM registrant update; filter=value pairs narrow it (e.g. "primary_naics=541512")
+AWARDEE_MIRROR_SCOPES = [
+    tuple(item.strip().split("=", 1)) if "=" in item else ("", "")
+    for item in os.environ.get("HIGHER_GOV_AWARDEE_MIRROR_SCOPES", "").split(",")
+    if "=" in item or item.strip() == "all"
+]
+
+# Upper bound on rows loaded for local reference tables (NAICS, PSC)
+REFERENCE_MAX_RECORDS = int(os.environ.get("HIGHER_GOV_REFERENCE_MAX_RECORDS", "20000"))
+
+# Maximum age of the agency hierarchy (and its on-disk copy) before the next agency lookup rebuilds it
+AGENCY_REFRESH_INTERVAL = float(os.environ.get("HIGHER_GOV_AGENCY_REFRESH_INTERVAL", str(CACHE_TTLS["agency"])))
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client if it was opened."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class TokenBucket:
+    """Token bucket holding up to `capacity` tokens, refilled evenly over `period` seconds."""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def level(self) -> float:
+        """Return the number of tokens currently available."""
+        self._refill()
+        return self.tokens
+
+    def wait_time(self) -> float:
+        """Return seconds until one token is available (0 if available now)."""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """Async limiter requiring one token from every bucket per request.
+
+    Waiters are served in arrival order: the lock is FIFO, and only its holder
+    sleeps for a refill, so a burst of callers is queued rather than rejected.
+    """
+
+    def __init__(self, buckets: dict[str, TokenBucket]):
+        self.buckets = buckets
+        self.waiting = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while (wait := max(b.wait_time() for b in self.buckets.values())) > 0:
+                    await asyncio.sleep(wait)
+                for bucket in self.buckets.values():
+                    bucket.take()
+        finally:
+            self.waiting -= 1
+
+    def status(self) -> dict:
+        """Return current bucket levels and the number of queued callers."""
+        return {
+            "waiting": self.waiting,
+            "buckets": {
+                name: {
+                    "available": round(b.level(), 2),
+                    "capacity": b.capacity,
+                    "used_pct": round(100 * (1 - b.level() / b.capacity), 2),
+                }
+                for name, b in self.buckets.items()
+            },
+        }
+
+
+rate_limiter = RateLimiter({
+    "per_second": TokenBucket(RATE_LIMIT_PER_SECOND, 1),
+    "per_day": TokenBucket(RATE_LIMIT_PER_DAY, 86400),
+})
+
+
+class ResponseCache:
+    """LRU cache of decoded responses with per-entry expiry and a total size bound in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, int, dict]] = OrderedDict()
+
+    def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+        if entry is not None:
+            self._remove(key)
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: dict, size: int, ttl: float) -> None:
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self.size += size
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def _remove(self, key: str) -> None:
+        self.size -= self._entries.pop(key)[1]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+response_cache = ResponseCache(CACHE_MAX_BYTES)
+
+
+class SQLiteStore:
+    """
+    SQLite database opened lazily, with its schema created on first use.
+
+    Calls run in worker threads (via asyncio.to_thread) and share one connection
+    guarded by a lock. Each process opens its own connection; SQLite's file locking
+    serializes writers and WAL lets readers proceed while another process writes.
+    """
+
+    pragmas: tuple[str, ...] = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL")
+    schema: tuple[str, ...] = ()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            for statement in self.pragmas + self.schema:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and run the block in one transaction, rolled back if it raises."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def sql_value(value: Any) -> Any:
+    """A value SQLite can bind: lists and dicts (e.g. a multi-code field) are stored as JSON text."""
+    return json.dumps(value) if isinstance(value, (list, dict)) else value
+
+
+class SyncedStore(SQLiteStore):
+    """SQLiteStore with a name/value table for sync bookkeeping such as high-water marks."""
+
+    schema = ("CREATE TABLE IF NOT EXISTS sync_state (name TEXT PRIMARY KEY, value TEXT)",)
+
+    def get_state(self, name: str) -> str | None:
+        with self._lock:
+            row = self._connect().execute("SELECT value FROM sync_state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, name: str, value: str) -> None:
+        with self._lock:
+            self._connect().execute("INSERT OR REPLACE INTO sync_state (name, value) VALUES (?, ?)", (name, value))
+
+    def delete_state(self, name: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM sync_state WHERE name = ?", (name,))
+
+    def states(self, prefix: str) -> dict[str, str]:
+        """Return every state entry whose name starts with `prefix`."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT name, value FROM sync_state WHERE substr(name, 1, ?) = ?", (len(prefix), prefix)
+            ).fetchall()
+        return dict(rows)
+
+
+class RecordMirror(SyncedStore):
+    """
+    Local mirror of one endpoint's records keyed by `key`, one typed column per field,
+    synced by walking `date_field` one day at a time.
+
+    Filters passed to query() are column names, optionally suffixed with an operator:
+    `__prefix` (code roll-up), `__gte` or `__lte` (ranges on amounts and dates), or
+    `__in` (any of a list of values).
+    """
+
+    FILTER_OPERATORS = {"": "=", "prefix": "LIKE", "gte": ">=", "lte": "<=", "in": "IN"}
+
+    def __init__(
+        self,
+        path: str,
+        table: str,
+        key: str,
+        columns: dict[str, str],
+        indexes: tuple[str | tuple[str, ...], ...] = (),
+        date_field: str = "last_modified_date",
+        key_type: str = "TEXT",
+    ):
+        super().__init__(path)
+        self.table = table
+        self.key = key
+        self.columns = columns
+        self.date_field = date_field
+        self.sync_lock = asyncio.Lock()
+        definitions = ", ".join(f"{name} {kind}" for name, kind in columns.items())
+        self.schema = (
+            *SyncedStore.schema,
+            f"CREATE TABLE IF NOT EXISTS {table} ({key} {key_type} PRIMARY KEY, {definitions}, synced_at REAL NOT NULL)",
+            *(
+                f"CREATE INDEX IF NOT EXISTS {table}_{'_'.join(columns)} ON {table} ({', '.join(columns)})"
+                for columns in (index if isinstance(index, tuple) else (index,) for index in indexes)
+            ),
+        )
+
+    def upsert(self, rows: list[dict]) -> int:
+        """Insert new rows and overwrite changed ones; return the number written."""
+        rows = [row for row in rows if row.get(self.key)]
+        if not rows:
+            return 0
+        names = [self.key, *self.columns, "synced_at"]
+        now = time.time()
+        with self.transaction() as conn:
+            conn.executemany(
+                f"INSERT INTO {self.table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+                f"ON CONFLICT ({self.key}) DO UPDATE SET "
+                + ", ".join(f"{name} = excluded.{name}" for name in names[1:]),
+                [(row[self.key], *(sql_value(row.get(name)) for name in self.columns), now) for row in rows],
+            )
+        return len(rows)
+
+    def where(self, filters: dict) -> tuple[str, list]:
+        """Build a WHERE clause (empty if no filters) and its arguments."""
+        clauses = []
+        args = []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            column, _, op = name.partition("__")
+            if (column not in self.columns and column != self.key) or op not in self.FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter: {name}")
+            if op == "in":
+                clauses.append(f"{column} IN ({','.join('?' * len(value))})" if value else "0")
+                args.extend(value)
+                continue
+            clauses.append(f"{column} {self.FILTER_OPERATORS[op]} ?")
+            args.append(f"{value}%" if op == "prefix" else value)
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), args
+
+    def query(self, filters: dict, ordering: str | None, limit: int, offset: int = 0) -> tuple[int, list[dict]]:
+        """Return (total matches, one page of rows) ordered by `ordering` ("column" or "-column")."""
+        clause, args = self.where(filters)
+        order = self.key
+        if ordering and ordering.lstrip("-") in self.columns:
+            order = f"{ordering.lstrip('-')}{' DESC' if ordering.startswith('-') else ''}, {self.key}"
+        names = [self.key, *self.columns]
+        with self._lock:
+            conn = self._connect()
+            total = conn.execute(f"SELECT COUNT(*) FROM {self.table} {clause}", args).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(names)} FROM {self.table} {clause} ORDER BY {order} LIMIT ? OFFSET ?",
+                [*args, limit, offset],
+            ).fetchall()
+        return total, [dict(zip(names, row)) for row in rows]
+
+    def aggregate(
+        self,
+        filters: dict,
+        group: str,
+        metric: str,
+        top_n: int,
+        percentiles: tuple[int, ...] = (25, 50, 75, 90),
+    ) -> dict:
+        """
+        Group matching rows by the SQL expression `group` and summarize `metric`.
+
+        Sums and counts run as one GROUP BY inside SQLite; percentiles are computed
+        from sorted values for the top_n groups by sum only.
+        """
+        if self.columns.get(metric) != "REAL":
+            raise ValueError(f"Unsupported metric: {metric}")
+        clause, args = self.where(filters)
+        with self._lock:
+            conn = self._connect()
+            count, total, groups = conn.execute(
+                f"SELECT COUNT(*), SUM({metric}), COUNT(DISTINCT {group}) FROM {self.table} {clause}", args
+            ).fetchone()
+            top = conn.execute(
+                f"SELECT {group} AS g, COUNT(*), SUM({metric}), AVG({metric}), MAX({metric}) "
+                f"FROM {self.table} {clause} GROUP BY g ORDER BY 3 DESC, 2 DESC LIMIT ?",
+                [*args, top_n],
+            ).fetchall()
+            values: dict = {key: [] for key, *_ in top}
+            if top:
+                in_top = f"{group} IN ({','.join('?' * len(top))})"
+                rows = conn.execute(
+                    f"SELECT {group}, {metric} FROM {self.table} "
+                    f"{clause + ' AND' if clause else 'WHERE'} {in_top} AND {metric} IS NOT NULL "
+                    f"ORDER BY {metric}",
+                    [*args, *values],
+                )
+                for key, value in rows:
+                    values[key].append(value)
+        results = []
+        for key, group_count, group_sum, mean, largest in top:
+            results.append({
+                "group": key,
+                "count": group_count,
+                "sum": group_sum,
+                "share": round(group_sum / total, 4) if total and group_sum else None,
+                "mean": mean,
+                "max": largest,
+                **{f"p{p}": percentile(values[key], p) for p in percentiles},
+            })
+        return {"records": count, "total": total, "group_count": groups, "groups": results}
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, last_synced = self._connect().execute(
+                f"SELECT COUNT(*), MAX(synced_at) FROM {self.table}"
+            ).fetchone()
+        state = {}
+        truncated = []
+        for name, value in self.states(f"{self.table}:").items():
+            name = name.split(":", 1)[1]
+            if name.startswith("truncated:"):
+                truncated.append(json.loads(value))
+            else:
+                state[name] = value
+        return {
+            "path": self.path,
+            "records": count,
+            "last_write": datetime.fromtimestamp(last_synced, timezone.utc).isoformat() if last_synced else None,
+            "state": state,
+            "truncated_days": sorted(truncated, key=lambda t: (t["scope"], t["day"])),
+        }
+
+
+class DiskCache(SQLiteStore):
+    """SQLite (WAL) response cache with zlib-compressed payloads, shared across processes."""
+
+    pragmas = ("PRAGMA auto_vacuum=INCREMENTAL", *SQLiteStore.pragmas)
+    schema = (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)",
+    )
+
+    def __init__(self, path: str, max_bytes: int):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> tuple[bytes, float] | None:
+        """Return (raw response body, remaining TTL seconds) for a fresh entry, else None."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return zlib.decompress(row[0]), row[1] - time.time()
+
+    def put(self, key: str, content: bytes, ttl: float) -> None:
+        payload = zlib.compress(content, 6)
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, size, payload) VALUES (?, ?, ?, ?)",
+                (key, time.time() + ttl, len(payload), payload),
+            )
+
+    def evict(self) -> int:
+        """Drop expired entries, then entries nearest expiry until under the size cap."""
+        with self._lock:
+            conn = self._connect()
+            removed = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),)).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                victims = []
+                for key, size in conn.execute("SELECT key, size FROM responses ORDER BY expires_at"):
+                    victims.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                removed += len(victims)
+            conn.execute("PRAGMA incremental_vacuum")
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
 
-async def hg_get(endpoint: str, params: dict) -> dict:
-    """Make authenticated GET request to HigherGov API."""
+disk_cache = DiskCache(DISK_CACHE_PATH, DISK_CACHE_MAX_BYTES) if DISK_CACHE_PATH else None
+
+
+async def maintain_disk_cache() -> None:
+    """Periodically evict expired and over-cap entries from the disk cache."""
+    while True:
+        await asyncio.sleep(DISK_CACHE_MAINTENANCE_INTERVAL)
+        try:
+            await asyncio.to_thread(disk_cache.evict)
+        except sqlite3.Error:
+            pass
+
+
+class QuotaExceededError(ToolError):
+    """Raised when a request would exceed the configured monthly record budget."""
+
+
+class QuotaAccountant(SQLiteStore):
+    """
+    Persistent per-month record counts by caller and endpoint, stored in SQLite.
+
+    Metering never fails a data call: if the database cannot be opened the counts are
+    kept in memory for this process, and later database errors are ignored.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS usage ("
+        "month TEXT NOT NULL, caller TEXT NOT NULL, endpoint TEXT NOT NULL, "
+        "records INTEGER NOT NULL DEFAULT 0, requests INTEGER NOT NULL DEFAULT 0, "
+        "PRIMARY KEY (month, caller, endpoint))",
+    )
+
+    def __init__(self, path: str, monthly_budget: int, caller_budget: int, mode: str):
+        super().__init__(path)
+        self.monthly_budget = monthly_budget
+        self.caller_budget = caller_budget
+        self.mode = mode
+        # Records reserved by in-flight requests, per caller
+        self._reserved: dict[str, int] = {}
+        self._reserve_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            return super()._connect()
+        except (sqlite3.Error, OSError):
+            if self.path == ":memory:":
+                raise
+            self.path = ":memory:"
+            return super()._connect()
+
+    @staticmethod
+    def current_month() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m")
+
+    def record(self, caller: str, endpoint: str, records: int, reserved: int = 0) -> None:
+        """Add a completed request's records to the usage table and release its reservation."""
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT INTO usage (month, caller, endpoint, records, requests) VALUES (?, ?, ?, ?, 1) "
+                    "ON CONFLICT (month, caller, endpoint) DO UPDATE SET "
+                    "records = records + excluded.records, requests = requests + 1",
+                    (self.current_month(), caller, endpoint, records),
+                )
+        except sqlite3.Error:
+            pass
+        finally:
+            self.release(caller, reserved)
+
+    def release(self, caller: str, reserved: int) -> None:
+        """Return records reserved by reserve() for a request that has finished or failed."""
+        if reserved:
+            with self._reserve_lock:
+                left = self._reserved.get(caller, 0) - reserved
+                if left > 0:
+                    self._reserved[caller] = left
+                else:
+                    self._reserved.pop(caller, None)
+
+    def remaining(self, caller: str) -> int | None:
+        """
+        Return records left under the tightest applicable budget, or None if unlimited.
+        Records reserved by in-flight requests count as used.
+        """
+        if not (self.monthly_budget or self.caller_budget):
+            return None
+        limits = []
+        with self._lock:
+            conn = self._connect()
+            month = self.current_month()
+            if self.monthly_budget:
+                used = conn.execute(
+                    "SELECT COALESCE(SUM(records), 0) FROM usage WHERE month = ?", (month,)
+                ).fetchone()[0]
+                limits.append(self.monthly_budget - used - sum(self._reserved.values()))
+            if self.caller_budget:
+                used = conn.execute(
+                    "SELECT COALESCE(SUM(records), 0) FROM usage WHERE month = ? AND caller = ?", (month, caller)
+                ).fetchone()[0]
+                limits.append(self.caller_budget - used - self._reserved.get(caller, 0))
+        return max(0, min(limits))
+
+    def reserve(self, caller: str, params: dict) -> tuple[dict, int]:
+        """
+        Return params adjusted to fit the remaining budget and the number of records
+        reserved for them, or raise QuotaExceededError.
+
+        The request's page_size is reserved up front and released by record() or
+        release(), so concurrent requests cannot together overrun the budget. A page
+        downsized to fit keeps its offset: page_size becomes the largest size within
+        budget that divides it, so the API returns the start of the requested page.
+        """
+        with self._reserve_lock:
+            try:
+                remaining = self.remaining(caller)
+            except sqlite3.Error:
+                remaining = None
+            if remaining is None:
+                return params, 0
+            if remaining <= 0:
+                raise QuotaExceededError(f"Monthly record budget exhausted for {caller}")
+            page_size = int(params.get("page_size") or 1)
+            if page_size > remaining:
+                if self.mode != "downsize":
+                    raise QuotaExceededError(
+                        f"Request for {page_size} records exceeds remaining budget of {remaining} for {caller}"
+                    )
+                offset = (int(params.get("page_number") or 1) - 1) * page_size
+                page_size = next(size for size in range(remaining, 0, -1) if offset % size == 0)
+                params = {**params, "page_number": offset // page_size + 1, "page_size": page_size}
+            self._reserved[caller] = self._reserved.get(caller, 0) + page_size
+        return params, page_size
+
+    def usage(self, month: str | None = None) -> dict:
+        month = month or self.current_month()
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT caller, endpoint, records, requests FROM usage WHERE month = ?", (month,)
+            ).fetchall()
+        by_endpoint: dict[str, dict] = {}
+        by_caller: dict[str, dict] = {}
+        for caller, endpoint, records, requests in rows:
+            for totals, name in ((by_endpoint, endpoint), (by_caller, caller)):
+                entry = totals.setdefault(name, {"records": 0, "requests": 0})
+                entry["records"] += records
+                entry["requests"] += requests
+        return {
+            "month": month,
+            "total_records": sum(r[2] for r in rows),
+            "total_requests": sum(r[3] for r in rows),
+            "by_endpoint": by_endpoint,
+            "by_caller": by_caller,
+            "monthly_budget": self.monthly_budget or None,
+            "caller_budget": self.caller_budget or None,
+            "budget_mode": self.mode,
+        }
+
+
+quota = QuotaAccountant(QUOTA_DB_PATH, MONTHLY_RECORD_BUDGET, CALLER_RECORD_BUDGET, BUDGET_MODE)
+
+
+def current_caller() -> str:
+    """Identify the MCP client (or session) behind the current tool call."""
+    try:
+        ctx = get_context()
+        return ctx.client_id or ctx.session_id or "unknown"
+    except RuntimeError:
+        return "local"
+
+
+def cache_key(endpoint: str, params: dict) -> str:
+    """Build a cache key from the endpoint and canonicalized params, excluding the API key."""
+    items = sorted((k, str(v)) for k, v in params.items() if v is not None and k != "api_key")
+    return f"{endpoint}?{urlencode(items)}"
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """Run background maintenance and release shared resources when the server shuts down."""
+    tasks = []
+    if disk_cache is not None:
+        tasks.append(asyncio.create_task(maintain_disk_cache()))
+    if OPPORTUNITY_SYNC_INTERVAL > 0:
+        tasks.append(asyncio.create_task(run_opportunity_sync()))
+    if MIRROR_SYNC_INTERVAL > 0:
+        tasks.append(asyncio.create_task(run_mirror_sync()))
+    try:
+        yield {}
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await close_client()
+        if disk_cache is not None:
+            disk_cache.close()
+        quota.close()
+        opportunity_store.close()
+        for mirror, _, _, _ in MIRRORS.values():
+            mirror.close()
+
+
+mcp = FastMCP("highergov-mcp", lifespan=lifespan)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
+    """Return seconds to wait before retrying after failed attempt number `attempt`."""
+    if response is not None:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after
+    delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (attempt - 1))
+    return delay + random.uniform(0, delay * RETRY_JITTER)
+
+
+async def fetch_with_retry(endpoint: str, params: dict) -> httpx.Response:
+    """Make authenticated GET request to HigherGov API, retrying transient failures."""
+    params = {**params, "api_key": HIGHERGOV_API_KEY}
+    deadline = time.monotonic() + RETRY_DEADLINE
+    attempt = 0
+    while True:
+        attempt += 1
+        await rate_limiter.acquire()
+        try:
+            r = await get_client().get(
+                f"{BASE_URL}/{endpoint}/",
+                params=params,
+                timeout=max(0.1, min(HTTP_TIMEOUT, deadline - time.monotonic())),
+            )
+            r.raise_for_status()
+            return r
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in RETRY_STATUSES:
+                raise
+            delay = retry_delay(attempt, e.response)
+            if attempt >= RETRY_MAX_ATTEMPTS or time.monotonic() + delay >= deadline:
+                raise
+        except httpx.TransportError:
+            delay = retry_delay(attempt)
+            if attempt >= RETRY_MAX_ATTEMPTS or time.monotonic() + delay >= deadline:
+                raise
+        await asyncio.sleep(delay)
+
+
+async def load_response(endpoint: str, params: dict, key: str, fresh: bool = False) -> dict:
+    """Load a response from the disk cache or the API and populate the caches."""
+    ttl = CACHE_TTLS.get(endpoint, 0)
+    if disk_cache is not None and ttl > 0 and not fresh:
+        hit = await asyncio.to_thread(disk_cache.get, key)
+        if hit is not None:
+            content, remaining = hit
+            data = decode_json(content)
+            response_cache.put(key, data, len(content), remaining)
+            return data
+    caller = current_caller()
+    allowed, reserved = await asyncio.to_thread(quota.reserve, caller, params)
+    try:
+        r = await fetch_with_retry(endpoint, allowed)
+        data = decode_json(r.content)
+    except BaseException:
+        quota.release(caller, reserved)
+        raise
+    results = data.get("results") if isinstance(data, dict) else None
+    await asyncio.to_thread(quota.record, caller, endpoint, len(results) if isinstance(results, list) else 0, reserved)
+    if allowed is not params:
+        # Downsized to fit the budget; don't cache a short page under the full-size key
+        if isinstance(results, list) and len(results) == allowed["page_size"]:
+            data = {**data, "budget_truncated": True}
+        return data
+    response_cache.put(key, data, len(r.content), ttl)
+    if disk_cache is not None and ttl > 0:
+        await asyncio.to_thread(disk_cache.put, key, r.content, ttl)
+    return data
+
+
+_inflight: dict[str, asyncio.Task] = {}
+coalesced_requests = 0
+
+
+async def hg_get(endpoint: str, params: dict, fresh: bool = False) -> dict:
+    """Make authenticated GET request to HigherGov API, served from cache when fresh.
+
+    Concurrent calls with the same endpoint and params share one upstream request.
+    Pass fresh=True to skip cached copies (the new response still refreshes the cache).
+    """
+    global coalesced_requests
     params = {k: v for k, v in params.items() if v is not None}
-    params["api_key"] = HIGHERGOV_API_KEY
-    async with httpx.AsyncClient(timeout=30) as client:
-        r = await client.get(f"{BASE_URL}/{endpoint}/", params=params)
-        r.raise_for_status()
-        return r.json()
+    key = cache_key(endpoint, params)
+    if not fresh:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+    flight = f"fresh:{key}" if fresh else key
+    task = _inflight.get(flight)
+    if task is None:
+        task = asyncio.create_task(load_response(endpoint, params, key, fresh))
+        _inflight[flight] = task
+        task.add_done_callback(lambda _: _inflight.pop(flight, None))
+    else:
+        coalesced_requests += 1
+    # Shield so one caller being cancelled does not cancel the request for the others
+    return await asyncio.shield(task)
 
 
 def today() -> str:
@@ -32,6 +938,696 @@ def days_ago(days: int) -> str:
     return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
 
+def select_fields(record: dict, fields: list[str] | None) -> dict:
+    """
+    Keep only the requested fields of an output record, in the requested order.
+
+    "name" keeps a whole field and "block.key" one key of a nested block. Fields a
+    record lacks come back as None so every record has the same shape.
+    """
+    if not fields:
+        return record
+    record = as_dict(record)
+    selected: dict = {}
+    for field in fields:
+        name, _, key = field.partition(".")
+        value = record.get(name)
+        if not key or not isinstance(value, dict):
+            selected[name] = value
+        elif selected.get(name) is not value:
+            selected.setdefault(name, {})[key] = value.get(key)
+    return selected
+
+
+def with_fields(record: Callable[[dict], dict], fields: list[str] | None) -> Callable[[dict], dict]:
+    """A record mapping that also applies select_fields (the mapping itself if no fields)."""
+    if not fields:
+        return record
+    return lambda raw: select_fields(record(raw), fields)
+
+
+def truncate_text(text: str, length: int) -> str:
+    """Cut text to `length` characters, marking the cut with an ellipsis."""
+    return text if len(text) <= length else text[:length].rstrip() + "…"
+
+
+def fit_response(
+    response: dict,
+    key: str,
+    handle: str,
+    text_fields: tuple[str, ...],
+    fields: list[str] | None,
+    max_chars: int | None,
+    max_response_tokens: int | None,
+    follow_up: str,
+) -> dict:
+    """
+    Apply select_fields to the records in response[key] and truncate their long text
+    fields to bound response size.
+
+    max_chars caps each text field. max_response_tokens (about CHARS_PER_TOKEN characters
+    each) caps the serialized response: text fields are cut to the longest common length
+    that fits and, if the records do not fit even with empty text, trailing records are
+    dropped. Cuts depend only on the input, so the same records always truncate the same
+    way. Each cut is listed under "elided" with the record's `handle` for fetching the
+    full text, taken from the record before `fields` trims it.
+    """
+    records = response.get(key) or []
+    if max_chars is None and max_response_tokens is None:
+        if fields:
+            response[key] = [select_fields(record, fields) for record in records]
+        return response
+    records = [as_dict(record) for record in records]
+    handles = [record.get(handle) for record in records]
+    records = [select_fields(record, fields) for record in records]
+    texts = [
+        (i, field, record[field])
+        for i, record in enumerate(records)
+        for field in text_fields
+        if isinstance(record.get(field), str) and record[field]
+    ]
+    cap = max_chars if max_chars is not None else max((len(text) for _, _, text in texts), default=0)
+
+    if max_response_tokens is not None:
+        budget = max_response_tokens * CHARS_PER_TOKEN
+        # Size of each record with its text cut to nothing, plus its worst-case "elided" entries.
+        # Only the text in `texts` is blanked; a None or empty field keeps its own size.
+        blanked: dict[int, dict] = {}
+        for i, field, _ in texts:
+            blanked.setdefault(i, {})[field] = ""
+        row_sizes = [len(json.dumps({**record, **blanked.get(i, {})})) + 2 for i, record in enumerate(records)]
+        for i, field, text in texts:
+            entry = {handle: handles[i], "field": field, "length": len(text), "kept": len(text)}
+            row_sizes[i] += len(json.dumps(entry)) + 2 + len(json.dumps(truncate_text(text, 0))) - 2
+        base = len(json.dumps({**response, key: [], "elided": {"follow_up": follow_up, "records": []}})) + sum(row_sizes)
+        keep = len(records)
+        while keep and base > budget:
+            if keep == len(records):
+                # Dropping records adds a "records_omitted" count to the response
+                base += len(json.dumps({"records_omitted": len(records)}))
+            keep -= 1
+            base -= row_sizes[keep]
+        if keep < len(records):
+            response["records_omitted"] = len(records) - keep
+            records = records[:keep]
+            texts = [entry for entry in texts if entry[0] < keep]
+
+        base -= sum(len(json.dumps(truncate_text(text, 0))) - 2 for _, _, text in texts)
+
+        def size(length: int) -> int:
+            return base + sum(len(json.dumps(truncate_text(text, length))) - 2 for _, _, text in texts)
+
+        low, high = 0, cap
+        while low < high:
+            mid = (low + high + 1) // 2
+            if size(mid) <= budget:
+                low = mid
+            else:
+                high = mid - 1
+        cap = low
+
+    records = list(records)
+    elided = []
+    for i, field, text in texts:
+        if len(text) > cap:
+            records[i] = {**records[i], field: truncate_text(text, cap)}
+            elided.append({handle: handles[i], "field": field, "length": len(text), "kept": cap})
+    response[key] = records
+    if elided:
+        response["elided"] = {"follow_up": follow_up, "records": elided}
+    return response
+
+
+def add_months(day: date, months: int) -> date:
+    """Shift a date by whole months, clamping to the last day of the target month."""
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    return day.replace(year=year, month=month + 1, day=min(day.day, calendar.monthrange(year, month + 1)[1]))
+
+
+def percentile(ordered: list[float], p: float) -> float | None:
+    """Linearly interpolated percentile of already sorted values."""
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * p / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+async def report_progress(progress: int, total: int) -> None:
+    """Send an MCP progress notification if called within a tool request."""
+    try:
+        ctx = get_context()
+    except RuntimeError:
+        return
+    await ctx.report_progress(progress, total)
+
+
+async def iter_pages(
+    endpoint: str,
+    params: dict,
+    max_records: int,
+    page_size: int = 100,
+    fresh: bool = False,
+) -> AsyncIterator[dict]:
+    """
+    Yield response pages in order until `max_records` are covered.
+
+    `max_records` is spread evenly over as few pages of up to `page_size` as cover it
+    (e.g. 120 as two pages of 60), so a walk costs at most one record per page more
+    quota than it returns. Page 1 is fetched first to learn meta.total_count; the
+    remaining pages are then fetched concurrently (bounded by PAGE_CONCURRENCY and
+    the rate limiter). Pending fetches are cancelled if the consumer stops early.
+    """
+    max_records = max(1, max_records)
+    page_size = math.ceil(max_records / math.ceil(max_records / page_size))
+    first = await hg_get(endpoint, {**params, "page_number": 1, "page_size": page_size}, fresh)
+    yield first
+    total = min(first.get("meta", {}).get("total_count", 0), max_records)
+    last_page = math.ceil(total / page_size)
+    if last_page <= 1 or len(first.get("results", [])) < page_size:
+        return
+
+    sem = asyncio.Semaphore(PAGE_CONCURRENCY)
+
+    async def fetch(page_number: int) -> dict:
+        async with sem:
+            return await hg_get(endpoint, {**params, "page_number": page_number, "page_size": page_size}, fresh)
+
+    tasks = [asyncio.create_task(fetch(n)) for n in range(2, last_page + 1)]
+    try:
+        for task in tasks:
+            page = await task
+            yield page
+            if len(page.get("results", [])) < page_size:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def fetch_all_records(endpoint: str, params: dict, record, max_records: int, key: str) -> dict:
+    """
+    Collect up to `max_records` records across all pages, mapping each with `record`.
+
+    If the record budget runs out partway, the records fetched so far are returned
+    with "budget_truncated" set.
+    """
+    max_records = max(1, min(max_records, FETCH_ALL_MAX_RECORDS))
+    records = []
+    total_count = 0
+    budget_truncated = False
+    try:
+        async for data in iter_pages(endpoint, params, max_records):
+            total_count = data.get("meta", {}).get("total_count", 0)
+            records.extend(record(r) for r in data.get("results", []))
+            await report_progress(min(len(records), max_records), min(total_count, max_records))
+            if data.get("budget_truncated"):
+                budget_truncated = len(records) < min(total_count, max_records)
+                break
+            if len(records) >= max_records:
+                break
+    except QuotaExceededError:
+        if not records:
+            raise
+        budget_truncated = True
+    result = {
+        "total_count": total_count,
+        "returned": min(len(records), max_records),
+        "truncated": budget_truncated or total_count > max_records,
+        key: records[:max_records],
+    }
+    if budget_truncated:
+        result["budget_truncated"] = True
+    return result
+
+
+async def fetch_all_across(
+    endpoint: str, params: dict, field: str, values: list, record, max_records: int, key: str
+) -> dict:
+    """
+    fetch_all_records over several values of a filter the API matches one value at a
+    time, merged in `values` order up to `max_records` in total.
+
+    Each value is probed first with a one-record page (at most PAGE_CONCURRENCY at a
+    time), so the combined total_count is exact and values with no matches cost no
+    further requests.
+    """
+    max_records = max(1, min(max_records, FETCH_ALL_MAX_RECORDS))
+    sem = asyncio.Semaphore(PAGE_CONCURRENCY)
+
+    async def probe(value) -> dict:
+        async with sem:
+            return await hg_get(endpoint, {**params, field: value, "page_number": 1, "page_size": 1})
+
+    probes = await asyncio.gather(*(probe(value) for value in values))
+    counts = [probe.get("meta", {}).get("total_count", 0) for probe in probes]
+    records = []
+    budget_truncated = False
+    for value, count in zip(values, counts):
+        if len(records) >= max_records:
+            break
+        if count:
+            try:
+                result = await fetch_all_records(
+                    endpoint, {**params, field: value}, record, max_records - len(records), key
+                )
+            except QuotaExceededError:
+                if not records:
+                    raise
+                budget_truncated = True
+                break
+            records.extend(result[key])
+            if result.get("budget_truncated"):
+                budget_truncated = True
+                break
+    total_count = sum(counts)
+    result = {
+        "total_count": total_count,
+        "returned": len(records),
+        "truncated": total_count > len(records),
+        key: records,
+    }
+    if budget_truncated:
+        result["budget_truncated"] = True
+    return result
+
+
+class Nested(NamedTuple):
+    """Spec source: `key` of the object in `field`; None (or a non-empty value itself if `flat`) otherwise."""
+
+    field: str
+    key: str
+    flat: bool = False
+
+
+class Each(NamedTuple):
+    """Spec source: `key` of every object in the list in `field` (plain items kept as-is)."""
+
+    field: str
+    key: str
+
+
+class When(NamedTuple):
+    """Spec source: the nested spec if `field` is set, otherwise None."""
+
+    field: str
+    spec: dict
+
+
+class Const(NamedTuple):
+    """Spec source: a fixed value."""
+
+    value: Any
+
+
+def build_projector(spec: dict, name: str, doc: str | None = None, model: type | None = None) -> Callable:
+    """
+    Build a function mapping a raw API record to output from a declarative field spec.
+
+    Spec values are a raw field name, a Nested/Each/When/Const source, a callable
+    taking the raw record, or a dict (a nested output object). The spec becomes one
+    straight-line function at import: each nested object is read once, nested output
+    objects are single dict displays and no spec is interpreted per record. With
+    `model` (see record_model) the function fills a model instance slot by slot
+    instead of building a dict.
+
+    The source is registered with linecache as "<projector NAME>", so tracebacks and
+    inspect.getsource show the generated lines.
+    """
+    namespace: dict = {"__name__": __name__, "_empty": {}}
+    nested: dict[str, int] = {}
+    prologue = ["get = record.get"]
+
+    def nested_get(field: str) -> int:
+        if field not in nested:
+            n = nested[field] = len(nested)
+            prologue.append(f"_n{n} = get({field!r})")
+            prologue.append(f"_d{n} = _n{n} if _n{n}.__class__ is dict else _empty")
+        return nested[field]
+
+    def expr(source) -> str:
+        if isinstance(source, str):
+            return f"get({source!r})"
+        if isinstance(source, Nested):
+            n = nested_get(source.field)
+            if source.flat:
+                return f"(_d{n}.get({source.key!r}) if _d{n} is not _empty else (_n{n} or None))"
+            return f"_d{n}.get({source.key!r})"
+        if isinstance(source, Each):
+            return (
+                f"[_x.get({source.key!r}) if _x.__class__ is dict else _x "
+                f"for _x in get({source.field!r}) or ()]"
+            )
+        if isinstance(source, When):
+            inner = expr(source.spec)
+            test = f"_n{nested[source.field]}" if source.field in nested else f"get({source.field!r})"
+            return f"({inner} if {test} else None)"
+        if isinstance(source, dict):
+            return "{" + ", ".join(f"{key!r}: {expr(value)}" for key, value in source.items()) + "}"
+        ref = f"_c{len(namespace)}"
+        if isinstance(source, Const):
+            namespace[ref] = source.value
+            return ref
+        if callable(source):
+            namespace[ref] = source
+            return f"{ref}(record)"
+        raise TypeError(f"Unsupported projection source for {name}: {source!r}")
+
+    if model is None:
+        body = [f"return {expr(spec)}"]
+    else:
+        namespace.update(_model=model, _new=object.__new__)
+        body = ["_out = _new(_model)", *(f"_out.{field} = {expr(value)}" for field, value in spec.items()), "return _out"]
+    filename = f"<projector {name}>"
+    source = f"def {name}(record):\n" + "".join(f"    {line}\n" for line in prologue + body)
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+    exec(compile(source, filename, "exec"), namespace)
+    projector = namespace[name]
+    projector.__doc__ = doc
+    return projector
+
+
+def record_model(name: str, spec: dict, doc: str) -> type:
+    """
+    A slots dataclass with one attribute per top-level field of a projection spec.
+
+    Instances take a fraction of the memory of the equivalent dict. Tools return them
+    as-is; FastMCP serializes dataclasses, so they become JSON only at the MCP boundary.
+    """
+    model = make_dataclass(name, [(field, Any) for field in spec], slots=True)
+    model.__module__ = __name__
+    model.__doc__ = doc
+    return model
+
+
+def as_dict(record) -> dict:
+    """A record as a plain dict (record models are converted field by field)."""
+    if isinstance(record, dict):
+        return record
+    return {field: getattr(record, field) for field in record.__slots__}
+
+
+def certification_list(a: dict) -> list[dict]:
+    """Business types from an awardee's bus_type_info with the SBA-certified flag."""
+    return [
+        {
+            "type": bt.get("bus_type"),
+            "description": bt.get("bus_type_description"),
+            "sba_certified": bt.get("cert_flag", False),
+        }
+        for bt in a.get("bus_type_info") or ()
+        if bt.__class__ is dict
+    ]
+
+
+def certification_summary(a: dict) -> dict:
+    """Certifications split into SBA-certified and self-certified descriptions."""
+    certifications = certification_list(a)
+    return {
+        "all": certifications,
+        "sba_certified": [c["description"] for c in certifications if c["sba_certified"]],
+        "self_certified": [c["description"] for c in certifications if not c["sba_certified"]],
+    }
+
+
+def certification_counts(a: dict) -> dict:
+    """certification_summary with the number of certifications."""
+    summary = certification_summary(a)
+    summary["count"] = len(summary["all"])
+    return summary
+
+
+def poc_name(a: dict) -> str | None:
+    """Full name of an awardee's government business point of contact."""
+    return f"{a.get('govt_bus_poc_first_name', '')} {a.get('govt_bus_poc_last_name', '')}".strip() or None
+
+
+def certification_descriptions(a: dict) -> list[str]:
+    """Descriptions of an awardee's business types."""
+    return [bt.get("bus_type_description") for bt in a.get("bus_type_info") or [] if isinstance(bt, dict)]
+
+
+AWARDEE_ADDRESS = {
+    "line1": "physical_address_line_1",
+    "line2": "physical_address_line_2",
+    "city": "physical_address_city",
+    "state": "physical_address_province_or_state",
+    "zip": "physical_address_zip_postal_code",
+    "country": "physical_address_country_code",
+}
+
+
+OPPORTUNITY_FIELDS = {
+    "opp_key": "opp_key",
+    "title": "title",
+    "description": "description_text",
+    "agency_name": Nested("agency", "agency_name"),
+    "agency_key": Nested("agency", "agency_key"),
+    "source_type": "source_type",
+    "source_id": "source_id",
+    "posted_date": "posted_date",
+    "captured_date": "captured_date",
+    "due_date": "due_date",
+    "naics_code": Nested("naics_code", "naics_code"),
+    "psc_code": Nested("psc_code", "psc_code"),
+    "set_aside": "set_aside",
+    "estimated_value_low": "val_est_low",
+    "estimated_value_high": "val_est_high",
+    "place_of_performance": {
+        "state": "pop_state",
+        "city": "pop_city",
+        "zip": "pop_zip",
+    },
+    "contact_name": Nested("primary_contact_email", "contact_name"),
+    "contact_email": Nested("primary_contact_email", "contact_email"),
+    "contact_phone": Nested("primary_contact_email", "contact_phone"),
+    "highergov_url": "path",
+    "source_url": "source_path",
+}
+OpportunityRecord = record_model("OpportunityRecord", OPPORTUNITY_FIELDS, "A normalized opportunity from the API.")
+opportunity_record = build_projector(
+    OPPORTUNITY_FIELDS, "opportunity_record", "Normalize a raw opportunity from the API.", model=OpportunityRecord
+)
+
+
+def fit_opportunities(
+    response: dict, fields: list[str] | None, max_chars: int | None, max_response_tokens: int | None
+) -> dict:
+    """Apply fit_response to opportunity descriptions, pointing back to search_opportunities."""
+    return fit_response(
+        response,
+        "opportunities",
+        "opp_key",
+        ("description",),
+        fields,
+        max_chars,
+        max_response_tokens,
+        "Call search_opportunities(opp_key=...) for the full text of an elided description",
+    )
+
+
+class OpportunityStore(SyncedStore):
+    """Local copy of opportunities keyed by opp_key, with the sync high-water mark."""
+
+    schema = (
+        *SyncedStore.schema,
+        "CREATE TABLE IF NOT EXISTS opportunities ("
+        "opp_key TEXT PRIMARY KEY, captured_date TEXT, posted_date TEXT, due_date TEXT, "
+        "agency_key INTEGER, source_type TEXT, naics_code TEXT, psc_code TEXT, set_aside TEXT, "
+        "record TEXT NOT NULL, synced_at REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS opportunities_captured_date ON opportunities (captured_date)",
+        "CREATE INDEX IF NOT EXISTS opportunities_posted_date ON opportunities (posted_date)",
+        "CREATE INDEX IF NOT EXISTS opportunities_agency_key ON opportunities (agency_key)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS opportunities_fts USING fts5("
+        "opp_key UNINDEXED, title, description, tokenize='porter unicode61')",
+        # Index rows stored before the full-text table existed
+        "INSERT INTO opportunities_fts (opp_key, title, description) "
+        "SELECT opp_key, json_extract(record, '$.title'), json_extract(record, '$.description') "
+        "FROM opportunities WHERE opp_key NOT IN (SELECT opp_key FROM opportunities_fts)",
+    )
+
+    ORDERINGS = {
+        "captured_date": "captured_date",
+        "-captured_date": "captured_date DESC",
+        "posted_date": "posted_date",
+        "-posted_date": "posted_date DESC",
+        "due_date": "due_date",
+        "-due_date": "due_date DESC",
+    }
+
+    def upsert(self, records: list[dict]) -> int:
+        """Insert or replace opportunities; return how many were not stored before."""
+        if not records:
+            return 0
+        keys = [r["opp_key"] for r in records if r.get("opp_key")]
+        placeholders = ",".join("?" * len(keys))
+        now = time.time()
+        with self.transaction() as conn:
+            known = {
+                row[0]
+                for row in conn.execute(f"SELECT opp_key FROM opportunities WHERE opp_key IN ({placeholders})", keys)
+            } if keys else set()
+            conn.execute(f"DELETE FROM opportunities_fts WHERE opp_key IN ({placeholders})", keys)
+            conn.executemany(
+                "INSERT INTO opportunities_fts (opp_key, title, description) VALUES (?, ?, ?)",
+                [(r["opp_key"], r.get("title"), r.get("description")) for r in records if r.get("opp_key")],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO opportunities (opp_key, captured_date, posted_date, due_date, agency_key, "
+                "source_type, naics_code, psc_code, set_aside, record, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        r["opp_key"], r.get("captured_date"), r.get("posted_date"), r.get("due_date"),
+                        r.get("agency_key"), r.get("source_type"), sql_value(r.get("naics_code")),
+                        sql_value(r.get("psc_code")), r.get("set_aside"), json.dumps(r), now,
+                    )
+                    for r in records if r.get("opp_key")
+                ],
+            )
+        return len(set(keys) - known)
+
+    def search(
+        self,
+        filters: dict,
+        ordering: str | None,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[int, list[dict]]:
+        """Return (total matches, one page of records) for equality/date filters."""
+        where = []
+        args: list = []
+        for column, value in filters.items():
+            if value is None:
+                continue
+            if column in ("captured_date", "posted_date", "due_date"):
+                # Dates may be stored with a time component; match the whole day
+                where.append(f"{column} >= ? AND {column} < ?")
+                args += [value, (date.fromisoformat(value) + timedelta(days=1)).isoformat()]
+            else:
+                where.append(f"{column} = ?")
+                args.append(value)
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        order = self.ORDERINGS.get(ordering or "-captured_date", "captured_date DESC")
+        with self._lock:
+            conn = self._connect()
+            total = conn.execute(f"SELECT COUNT(*) FROM opportunities {clause}", args).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT record FROM opportunities {clause} ORDER BY {order}, opp_key LIMIT ? OFFSET ?",
+                [*args, limit, offset],
+            ).fetchall()
+        return total, [decode_json(row[0]) for row in rows]
+
+    def search_text(
+        self,
+        query: str,
+        filters: dict,
+        match_any: bool,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[int, list[dict]]:
+        """
+        Full-text search over titles and descriptions, ranked by BM25 (title weighted 10x).
+
+        Filters: naics_code/psc_code match as code prefixes, set_aside and agency_key
+        exactly, due_after/due_before bound due_date inclusively.
+        """
+        terms = [f'"{token}"' for token in tokenize(query)]
+        if not terms:
+            return 0, []
+        where = ["opportunities_fts MATCH ?"]
+        args: list = [(" OR " if match_any else " ").join(terms)]
+        for column in ("naics_code", "psc_code"):
+            if filters.get(column):
+                where.append(f"o.{column} LIKE ?")
+                args.append(f"{filters[column]}%")
+        for column in ("set_aside", "agency_key"):
+            if filters.get(column) is not None:
+                where.append(f"o.{column} = ?")
+                args.append(filters[column])
+        if filters.get("due_after"):
+            where.append("o.due_date >= ?")
+            args.append(filters["due_after"])
+        if filters.get("due_before"):
+            where.append("o.due_date < ?")
+            args.append((date.fromisoformat(filters["due_before"]) + timedelta(days=1)).isoformat())
+        clause = " AND ".join(where)
+        joined = "FROM opportunities_fts JOIN opportunities o ON o.opp_key = opportunities_fts.opp_key"
+        with self._lock:
+            conn = self._connect()
+            total = conn.execute(f"SELECT COUNT(*) {joined} WHERE {clause}", args).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT o.record, bm25(opportunities_fts, 0, 10.0, 1.0) AS score, "
+                f"snippet(opportunities_fts, 2, '[', ']', '...', 24) "
+                f"{joined} WHERE {clause} ORDER BY score LIMIT ? OFFSET ?",
+                [*args, limit, offset],
+            ).fetchall()
+        results = []
+        for record, score, snippet in rows:
+            results.append({**decode_json(record), "score": round(-score, 4), "snippet": snippet})
+        return total, results
+
+    def stats(self) -> dict:
+        with self._lock:
+            conn = self._connect()
+            count, newest = conn.execute("SELECT COUNT(*), MAX(captured_date) FROM opportunities").fetchone()
+            state = dict(conn.execute("SELECT name, value FROM sync_state").fetchall())
+        return {"path": self.path, "opportunities": count, "newest_captured_date": newest, **state}
+
+
+opportunity_store = OpportunityStore(OPPORTUNITY_DB_PATH)
+_opportunity_sync_lock = asyncio.Lock()
+
+
+async def sync_opportunities() -> dict:
+    """
+    Fetch opportunities captured since the high-water mark into the local store.
+
+    Each captured_date from the high-water day through today is walked newest first;
+    a day stops paging at the first page with no unseen opp_key, so a repeat cycle
+    costs one request per day re-checked. The high-water day itself is always
+    re-checked because HigherGov keeps adding to it until the day is over.
+    """
+    async with _opportunity_sync_lock:
+        high_water = await asyncio.to_thread(opportunity_store.get_state, "high_water")
+        day = date.fromisoformat(high_water or days_ago(OPPORTUNITY_SYNC_BACKFILL_DAYS))
+        fetched = added = requests = 0
+        while day <= date.today():
+            page_number = 1
+            while True:
+                data = await hg_get("opportunity", {
+                    "captured_date": day.isoformat(),
+                    "ordering": "-captured_date",
+                    "page_number": page_number,
+                    "page_size": 100,
+                }, fresh=True)
+                requests += 1
+                records = [as_dict(opportunity_record(opp)) for opp in data.get("results", [])]
+                new = await asyncio.to_thread(opportunity_store.upsert, records)
+                fetched += len(records)
+                added += new
+                if len(records) < 100 or new == 0:
+                    break
+                page_number += 1
+            await asyncio.to_thread(opportunity_store.set_state, "high_water", day.isoformat())
+            day += timedelta(days=1)
+        await asyncio.to_thread(opportunity_store.set_state, "last_sync", datetime.now(timezone.utc).isoformat())
+        return {"requests": requests, "fetched": fetched, "added": added, "high_water": (day - timedelta(days=1)).isoformat()}
+
+
+async def run_opportunity_sync() -> None:
+    """Run sync_opportunities every OPPORTUNITY_SYNC_INTERVAL seconds."""
+    while True:
+        try:
+            await sync_opportunities()
+        except (httpx.HTTPError, ToolError, sqlite3.Error):
+            pass
+        await asyncio.sleep(OPPORTUNITY_SYNC_INTERVAL)
+
+
 @mcp.tool
 async def search_opportunities(
     captured_date: str | None = None,
@@ -43,6 +1639,12 @@ async def search_opportunities(
     ordering: str | None = None,
     page_number: int = 1,
     page_size: int = 25,
+    fetch_all: bool = False,
+    max_records: int = 1000,
+    local: bool = False,
+    fields: list[str] | None = None,
+    max_chars: int | None = None,
+    max_response_tokens: int | None = None,
 ) -> dict:
     """
     Search federal contract and grant opportunities from HigherGov.
@@ -60,6 +1662,16 @@ async def search_opportunities(
         ordering: Sort order (-captured_date, -posted_date, -due_date)
         page_number: Page number (default 1)
         page_size: Results per page (max 100, default 25)
+        fetch_all: Walk all pages server-side in one call (ignores page_number/page_size)
+        max_records: Stop after this many records when fetch_all is set (default 1000)
+        local: Query the locally synced opportunity store instead of the API (no quota used;
+            search_id is not supported)
+        fields: Only return these fields of each record (e.g. ["title", "due_date", "set_aside"]);
+            use "block.key" for one key of a nested block (e.g. "place_of_performance.state")
+        max_chars: Truncate each description to this many characters
+        max_response_tokens: Keep the whole response under roughly this many tokens by
+            truncating descriptions evenly (and dropping trailing records if needed).
+            Elided descriptions are listed under "elided" by opp_key.
 
     Returns:
         Paginated list of opportunities
@@ -68,7 +1680,31 @@ async def search_opportunities(
     if not any([captured_date, posted_date, agency_key, opp_key, search_id]):
         captured_date = today()
 
-    data = await hg_get("opportunity", {
+    if local:
+        if search_id:
+            return {"error": "search_id is not supported for local search", "opportunities": []}
+        total, opportunities = await asyncio.to_thread(
+            opportunity_store.search,
+            {
+                "captured_date": captured_date,
+                "posted_date": posted_date,
+                "agency_key": agency_key,
+                "opp_key": opp_key,
+                "source_type": source_type,
+            },
+            ordering,
+            page_size,
+            (page_number - 1) * page_size,
+        )
+        return fit_opportunities({
+            "total_count": total,
+            "page": page_number,
+            "page_size": page_size,
+            "source": "local",
+            "opportunities": opportunities,
+        }, fields, max_chars, max_response_tokens)
+
+    params = {
         "captured_date": captured_date,
         "posted_date": posted_date,
         "agency_key": agency_key,
@@ -76,51 +1712,241 @@ async def search_opportunities(
         "search_id": search_id,
         "source_type": source_type,
         "ordering": ordering or "-captured_date",
+    }
+
+    if fetch_all:
+        return fit_opportunities(await fetch_all_records(
+            "opportunity", params, opportunity_record, max_records, "opportunities"
+        ), fields, max_chars, max_response_tokens)
+
+    data = await hg_get("opportunity", {
+        **params,
         "page_number": page_number,
         "page_size": min(page_size, 100),
     })
 
-    opportunities = []
-    for opp in data.get("results", []):
-        agency = opp.get("agency") or {}
-        naics = opp.get("naics_code") or {}
-        psc = opp.get("psc_code") or {}
-        contact = opp.get("primary_contact_email") or {}
-
-        opportunities.append({
-            "opp_key": opp.get("opp_key"),
-            "title": opp.get("title"),
-            "description": opp.get("description_text"),
-            "agency_name": agency.get("agency_name"),
-            "agency_key": agency.get("agency_key"),
-            "source_type": opp.get("source_type"),
-            "source_id": opp.get("source_id"),
-            "posted_date": opp.get("posted_date"),
-            "captured_date": opp.get("captured_date"),
-            "due_date": opp.get("due_date"),
-            "naics_code": naics.get("naics_code"),
-            "psc_code": psc.get("psc_code"),
-            "set_aside": opp.get("set_aside"),
-            "estimated_value_low": opp.get("val_est_low"),
-            "estimated_value_high": opp.get("val_est_high"),
-            "place_of_performance": {
-                "state": opp.get("pop_state"),
-                "city": opp.get("pop_city"),
-                "zip": opp.get("pop_zip"),
-            },
-            "contact_name": contact.get("contact_name"),
-            "contact_email": contact.get("contact_email"),
-            "contact_phone": contact.get("contact_phone"),
-            "highergov_url": opp.get("path"),
-            "source_url": opp.get("source_path"),
-        })
+    opportunities = [opportunity_record(opp) for opp in data.get("results", [])]
 
-    return {
+    return fit_opportunities({
         "total_count": data.get("meta", {}).get("total_count", 0),
         "page": page_number,
         "page_size": page_size,
         "opportunities": opportunities,
-    }
+    }, fields, max_chars, max_response_tokens)
+
+
+@mcp.tool
+async def search_opportunities_text(
+    query: str,
+    naics_code: str | None = None,
+    psc_code: str | None = None,
+    set_aside: str | None = None,
+    agency_key: int | None = None,
+    due_after: str | None = None,
+    due_before: str | None = None,
+    match_any: bool = False,
+    page_number: int = 1,
+    page_size: int = 25,
+    fields: list[str] | None = None,
+    max_chars: int | None = None,
+    max_response_tokens: int | None = None,
+) -> dict:
+    """
+    Keyword search over opportunity titles and descriptions, ranked by relevance (BM25).
+    Runs against the locally synced opportunity store (see sync_opportunities_now);
+    no API quota is used.
+
+    Args:
+        query: Keywords to search for (e.g. "zero trust network")
+        naics_code: NAICS code or prefix (e.g. "5415")
+        psc_code: PSC code or prefix (e.g. "D3")
+        set_aside: Exact set-aside value
+        agency_key: HigherGov agency key
+        due_after: Only opportunities due on or after this date (YYYY-MM-DD)
+        due_before: Only opportunities due on or before this date (YYYY-MM-DD)
+        match_any: Match any keyword instead of all keywords
+        page_number: Page number
+        page_size: Results per page
+        fields: Only return these fields of each record (e.g. ["opp_key", "title", "due_date"]);
+            use "block.key" for one key of a nested block (e.g. "place_of_performance.state")
+        max_chars: Truncate each description to this many characters
+        max_response_tokens: Keep the whole response under roughly this many tokens by
+            truncating descriptions evenly (and dropping trailing records if needed).
+            Elided descriptions are listed under "elided" by opp_key.
+
+    Returns:
+        Matching opportunities, best first, each with a relevance score and a
+        highlighted description snippet
+    """
+    total, opportunities = await asyncio.to_thread(
+        opportunity_store.search_text,
+        query,
+        {
+            "naics_code": naics_code,
+            "psc_code": psc_code,
+            "set_aside": set_aside,
+            "agency_key": agency_key,
+            "due_after": due_after,
+            "due_before": due_before,
+        },
+        match_any,
+        page_size,
+        (page_number - 1) * page_size,
+    )
+    return fit_opportunities({
+        "total_count": total,
+        "page": page_number,
+        "opportunities": opportunities,
+    }, fields, max_chars, max_response_tokens)
+
+
+CONTRACT_FIELDS = {
+    "contract_key": "contract_key",
+    "award_id": "award_id",
+    "title": "title",
+    "description": "description",
+    "awarding_agency": Nested("awarding_agency", "agency_name"),
+    "awardee_name": Nested("awardee", "clean_name"),
+    "awardee_uei": Nested("awardee", "uei"),
+    "awardee_cage": Nested("awardee", "cage_code"),
+    "obligated_amount": "obligated_amount",
+    "potential_value": "potential_value",
+    "base_and_all_options": "base_and_all_options_value",
+    "start_date": "period_of_performance_start_date",
+    "end_date": "period_of_performance_current_end_date",
+    "naics_code": Nested("naics_code", "naics_code", flat=True),
+    "psc_code": Nested("psc_code", "psc_code", flat=True),
+    "place_of_performance_state": "place_of_performance_state",
+    "contract_type": "type_of_contract",
+    "set_aside": "type_of_set_aside",
+    "last_modified_date": "last_modified_date",
+    "highergov_url": "path",
+}
+ContractRecord = record_model("ContractRecord", CONTRACT_FIELDS, "A normalized contract award from the API.")
+contract_record = build_projector(
+    CONTRACT_FIELDS, "contract_record", "Normalize a raw contract award from the API.", model=ContractRecord
+)
+
+
+contract_row = build_projector(
+    {
+        **CONTRACT_FIELDS,
+        "awarding_agency_key": Nested("awarding_agency", "agency_key"),
+        "awardee_key": Nested("awardee", "awardee_key"),
+    },
+    "contract_row",
+    "Flatten a raw contract award into a contract mirror row.",
+)
+
+
+contract_mirror = RecordMirror(
+    MIRROR_DB_PATH,
+    "contracts",
+    "contract_key",
+    {
+        "award_id": "TEXT",
+        "title": "TEXT",
+        "description": "TEXT",
+        "awarding_agency": "TEXT",
+        "awarding_agency_key": "INTEGER",
+        "awardee_name": "TEXT",
+        "awardee_uei": "TEXT",
+        "awardee_cage": "TEXT",
+        "awardee_key": "INTEGER",
+        "obligated_amount": "REAL",
+        "potential_value": "REAL",
+        "base_and_all_options": "REAL",
+        "start_date": "TEXT",
+        "end_date": "TEXT",
+        "naics_code": "TEXT",
+        "psc_code": "TEXT",
+        "place_of_performance_state": "TEXT",
+        "contract_type": "TEXT",
+        "set_aside": "TEXT",
+        "last_modified_date": "TEXT",
+        "highergov_url": "TEXT",
+    },
+    indexes=(
+        "naics_code", "psc_code", "awarding_agency_key", "awardee_uei", "last_modified_date", "end_date",
+        # Expiration windows within one code or agency (find_expiring_contracts)
+        ("naics_code", "end_date"), ("psc_code", "end_date"), ("awarding_agency_key", "end_date"),
+    ),
+)
+
+
+async def sync_mirror_day(mirror: RecordMirror, endpoint: str, field: str, value: str, day: date, row) -> dict:
+    """
+    Fetch one scope's modifications for one day (up to MIRROR_MAX_RECORDS_PER_DAY).
+
+    A day with more modifications than the cap is recorded in the mirror's sync state
+    as truncated; a later complete fetch of the day clears the record.
+    """
+    params = {mirror.date_field: day.isoformat()}
+    if field:
+        params[field] = value
+    written = fetched = total = 0
+    async for page in iter_pages(endpoint, params, MIRROR_MAX_RECORDS_PER_DAY, fresh=True):
+        total = max(total, page.get("meta", {}).get("total_count", 0))
+        results = page.get("results", [])
+        fetched += len(results)
+        written += await asyncio.to_thread(mirror.upsert, [row(r) for r in results])
+    scope = f"{field}={value}" if field else "all"
+    marker = f"{mirror.table}:truncated:{scope}:{day.isoformat()}"
+    truncated = None
+    if total > fetched:
+        truncated = {
+            "scope": scope, "day": day.isoformat(), "fetched": fetched,
+            "total_count": total, "cap": MIRROR_MAX_RECORDS_PER_DAY,
+        }
+        await asyncio.to_thread(mirror.set_state, marker, json.dumps(truncated))
+    else:
+        await asyncio.to_thread(mirror.delete_state, marker)
+    return {"written": written, "truncated": truncated}
+
+
+async def sync_mirror(mirror: RecordMirror, endpoint: str, scopes: list[tuple[str, str]], row) -> dict:
+    """
+    Bring a mirror up to date with records modified since each scope's high-water day.
+
+    Days run through yesterday (upstream loads each day's modifications once a day).
+    The high-water day is fetched again, bypassing the cache, in case upstream added
+    to it after the previous sync; upserts make the overlap harmless.
+
+    Days cut off by MIRROR_MAX_RECORDS_PER_DAY are reported in the result (and by
+    get_mirror_status) and fetched again once the cap is raised above the one they
+    were cut at.
+    """
+    async with mirror.sync_lock:
+        written = 0
+        truncated = []
+        last_day = date.today() - timedelta(days=1)
+        for field, value in scopes:
+            scope = f"{field}={value}" if field else "all"
+            state = f"{mirror.table}:{scope}"
+            pending = await asyncio.to_thread(mirror.states, f"{mirror.table}:truncated:{scope}:")
+            for entry in map(json.loads, pending.values()):
+                if MIRROR_MAX_RECORDS_PER_DAY > entry["cap"]:
+                    result = await sync_mirror_day(
+                        mirror, endpoint, field, value, date.fromisoformat(entry["day"]), row
+                    )
+                    written += result["written"]
+                    if result["truncated"]:
+                        truncated.append(result["truncated"])
+            high_water = await asyncio.to_thread(mirror.get_state, state)
+            day = date.fromisoformat(high_water) if high_water else date.today() - timedelta(days=MIRROR_BACKFILL_DAYS)
+            while day <= last_day:
+                result = await sync_mirror_day(mirror, endpoint, field, value, day, row)
+                written += result["written"]
+                if result["truncated"]:
+                    truncated.append(result["truncated"])
+                await asyncio.to_thread(mirror.set_state, state, day.isoformat())
+                day += timedelta(days=1)
+        await asyncio.to_thread(mirror.set_state, f"{mirror.table}:last_sync", datetime.now(timezone.utc).isoformat())
+        return {
+            "records_written": written,
+            "scopes": [f"{field}={value}" if field else "all" for field, value in scopes],
+            "truncated_days": truncated,
+        }
 
 
 @mcp.tool
@@ -136,6 +1962,11 @@ async def search_contracts(
     ordering: str | None = None,
     page_number: int = 1,
     page_size: int = 25,
+    fetch_all: bool = False,
+    max_records: int = 1000,
+    local: bool = False,
+    fields: list[str] | None = None,
+    include_subagencies: bool = False,
 ) -> dict:
     """
     Search federal contract awards (61M+ records). Updated daily.
@@ -154,14 +1985,50 @@ async def search_contracts(
         ordering: Sort order (-last_modified_date, -obligated_amount)
         page_number: Page number
         page_size: Results per page (max 100)
+        fetch_all: Walk all pages server-side in one call (ignores page_number/page_size)
+        max_records: Stop after this many records when fetch_all is set (default 1000)
+        local: Query the local contract mirror instead of the API (no quota used; NAICS/PSC
+            match as prefixes; search_id is not supported)
+        fields: Only return these fields of each record (e.g. ["award_id", "awardee_name", "obligated_amount"])
+        include_subagencies: Also match every agency beneath awarding_agency_key in the
+            agency hierarchy (e.g. all of DoD). Against the API this requires fetch_all
+            and runs one query per agency with matches, up to max_records in total
 
     Returns:
-        Paginated list of contract awards
+        Paginated list of contract awards, or all matching awards up to max_records
     """
     if not any([naics_code, psc_code, awardee_key, awardee_uei, awarding_agency_key, award_id, search_id, last_modified_date]):
         return {"error": "At least one filter parameter is required", "contracts": []}
-
-    data = await hg_get("contract", {
+    if include_subagencies and awarding_agency_key is None:
+        return {"error": "include_subagencies requires awarding_agency_key", "contracts": []}
+    if include_subagencies and not (local or fetch_all):
+        # One page of the merged results would still cost a probe per sub-agency
+        return {"error": "include_subagencies requires fetch_all=True or local=True", "contracts": []}
+    agency_keys = await expand_agency_keys(awarding_agency_key) if include_subagencies else None
+
+    if local:
+        if search_id:
+            return {"error": "search_id is not supported for local search", "contracts": []}
+        total, contracts = await asyncio.to_thread(
+            contract_mirror.query,
+            {
+                "naics_code__prefix": naics_code,
+                "psc_code__prefix": psc_code,
+                "awardee_key": awardee_key,
+                "awardee_uei": awardee_uei,
+                "awarding_agency_key": None if agency_keys else awarding_agency_key,
+                "awarding_agency_key__in": agency_keys,
+                "award_id": award_id,
+                "last_modified_date": last_modified_date,
+            },
+            ordering or "-last_modified_date",
+            page_size,
+            (page_number - 1) * page_size,
+        )
+        contracts = [select_fields(c, fields) for c in contracts]
+        return {"total_count": total, "page": page_number, "source": "local", "contracts": contracts}
+
+    params = {
         "naics_code": naics_code,
         "psc_code": psc_code,
         "awardee_key": awardee_key,
@@ -171,39 +2038,25 @@ async def search_contracts(
         "search_id": search_id,
         "last_modified_date": last_modified_date,
         "ordering": ordering or "-last_modified_date",
+    }
+
+    if agency_keys:
+        return await fetch_all_across(
+            "contract", params, "awarding_agency_key", agency_keys, with_fields(contract_record, fields),
+            max_records, "contracts",
+        )
+
+    if fetch_all:
+        return await fetch_all_records("contract", params, with_fields(contract_record, fields), max_records, "contracts")
+
+    data = await hg_get("contract", {
+        **params,
         "page_number": page_number,
         "page_size": min(page_size, 100),
     })
 
-    contracts = []
-    for c in data.get("results", []):
-        awardee = c.get("awardee") or {}
-        agency = c.get("awarding_agency") or {}
-        naics = c.get("naics_code") or {}
-        psc = c.get("psc_code") or {}
-
-        contracts.append({
-            "contract_key": c.get("contract_key"),
-            "award_id": c.get("award_id"),
-            "title": c.get("title"),
-            "description": c.get("description"),
-            "awarding_agency": agency.get("agency_name"),
-            "awardee_name": awardee.get("clean_name"),
-            "awardee_uei": awardee.get("uei"),
-            "awardee_cage": awardee.get("cage_code"),
-            "obligated_amount": c.get("obligated_amount"),
-            "potential_value": c.get("potential_value"),
-            "base_and_all_options": c.get("base_and_all_options_value"),
-            "start_date": c.get("period_of_performance_start_date"),
-            "end_date": c.get("period_of_performance_current_end_date"),
-            "naics_code": naics.get("naics_code") if isinstance(naics, dict) else naics,
-            "psc_code": psc.get("psc_code") if isinstance(psc, dict) else psc,
-            "place_of_performance_state": c.get("place_of_performance_state"),
-            "contract_type": c.get("type_of_contract"),
-            "set_aside": c.get("type_of_set_aside"),
-            "last_modified_date": c.get("last_modified_date"),
-            "highergov_url": c.get("path"),
-        })
+    record = with_fields(contract_record, fields)
+    contracts = [record(c) for c in data.get("results", [])]
 
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
@@ -212,6 +2065,252 @@ async def search_contracts(
     }
 
 
+@mcp.tool
+async def find_expiring_contracts(
+    months_from: int = 6,
+    months_to: int = 18,
+    naics_code: str | None = None,
+    psc_code: str | None = None,
+    awarding_agency_key: int | None = None,
+    min_potential_value: float | None = None,
+    end_date_from: str | None = None,
+    end_date_to: str | None = None,
+    page_number: int = 1,
+    page_size: int = 50,
+    fields: list[str] | None = None,
+) -> dict:
+    """
+    Find recompete candidates: mirrored contract awards whose current period of
+    performance ends within a window, soonest first, with incumbent and value.
+
+    Served from the local contract mirror (see get_mirror_status), whose end-date
+    indexes per NAICS, PSC and agency answer window queries without paging the API.
+
+    Args:
+        months_from: Window start, in months from today (default 6)
+        months_to: Window end, in months from today (default 18)
+        naics_code: NAICS code; a full 6-digit code matches exactly, shorter codes as prefixes
+        psc_code: PSC code; a full 4-character code matches exactly, shorter codes as prefixes
+        awarding_agency_key: HigherGov agency key
+        min_potential_value: Only awards with at least this potential value
+        end_date_from: Explicit window start (YYYY-MM-DD), overrides months_from
+        end_date_to: Explicit window end (YYYY-MM-DD), overrides months_to
+        page_number: Page number
+        page_size: Results per page (max 100)
+        fields: Only return these fields of each record (e.g. ["award_id", "awardee_name", "days_remaining"])
+
+    Returns:
+        Expiring awards ordered by end date, with days remaining
+    """
+    start = date.today()
+    window_from = end_date_from or add_months(start, months_from).isoformat()
+    window_to = end_date_to or add_months(start, months_to).isoformat()
+    if window_from > window_to:
+        return {"error": "Window start is after window end", "contracts": []}
+
+    filters = {
+        "end_date__gte": window_from,
+        "end_date__lte": window_to,
+        "awarding_agency_key": awarding_agency_key,
+        "potential_value__gte": min_potential_value,
+    }
+    if naics_code:
+        filters["naics_code" if len(naics_code) == 6 else "naics_code__prefix"] = naics_code
+    if psc_code:
+        filters["psc_code" if len(psc_code) == 4 else "psc_code__prefix"] = psc_code
+
+    page_size = min(page_size, 100)
+    total, contracts = await asyncio.to_thread(
+        contract_mirror.query, filters, "end_date", page_size, (page_number - 1) * page_size
+    )
+    for contract in contracts:
+        end = contract.get("end_date")
+        contract["days_remaining"] = (date.fromisoformat(end[:10]) - start).days if end else None
+
+    return {
+        "window": {"from": window_from, "to": window_to},
+        "total_count": total,
+        "page": page_number,
+        "source": "local",
+        "contracts": [select_fields(c, fields) for c in contracts],
+    }
+
+
+# Fiscal year of the period of performance start (federal FY begins October 1)
+FISCAL_YEAR_SQL = "CAST(substr(start_date, 1, 4) AS INTEGER) + (substr(start_date, 6, 2) >= '10')"
+
+CONTRACT_GROUPS = {
+    "naics_code": "naics_code",
+    "naics_sector": "substr(naics_code, 1, 2)",
+    "psc_code": "psc_code",
+    "agency": "awarding_agency",
+    "awardee": "awardee_name",
+    "state": "place_of_performance_state",
+    "fiscal_year": FISCAL_YEAR_SQL,
+}
+
+
+@mcp.tool
+async def aggregate_contracts(
+    group_by: str = "naics_code",
+    metric: str = "obligated_amount",
+    naics_code: str | None = None,
+    psc_code: str | None = None,
+    awarding_agency_key: int | None = None,
+    awardee_uei: str | None = None,
+    state: str | None = None,
+    start_date_from: str | None = None,
+    start_date_to: str | None = None,
+    top_n: int = 10,
+    local: bool = True,
+    max_records: int = 1000,
+) -> dict:
+    """
+    Size a market server-side: group contract awards and return sums, counts,
+    shares and percentiles per group instead of pages of raw awards.
+
+    Args:
+        group_by: naics_code, naics_sector, psc_code, agency, awardee, state or fiscal_year
+        metric: obligated_amount, potential_value or base_and_all_options
+        naics_code: NAICS code (prefix match locally, e.g. "5415")
+        psc_code: PSC code (prefix match locally)
+        awarding_agency_key: HigherGov agency key
+        awardee_uei: Awardee UEI
+        state: Place of performance state (e.g. "VA")
+        start_date_from: Earliest period of performance start date (YYYY-MM-DD)
+        start_date_to: Latest period of performance start date (YYYY-MM-DD)
+        top_n: Number of groups to return, largest sum first (max 100)
+        local: Aggregate the local contract mirror (default). If False, fetch matching
+            awards from the API first (uses record quota; NAICS/PSC match exactly).
+        max_records: Cap on awards fetched from the API when local is False (up to
+            HIGHER_GOV_FETCH_ALL_MAX_RECORDS); the response reports the upstream
+            total_count and whether the aggregated set was truncated
+
+    Returns:
+        Totals over the matching awards and per-group statistics for the top groups
+    """
+    if group_by not in CONTRACT_GROUPS:
+        return {"error": f"group_by must be one of: {', '.join(CONTRACT_GROUPS)}"}
+    if metric not in ("obligated_amount", "potential_value", "base_and_all_options"):
+        return {"error": "metric must be obligated_amount, potential_value or base_and_all_options"}
+
+    filters = {
+        "place_of_performance_state": state,
+        "start_date__gte": start_date_from,
+        "start_date__lte": start_date_to,
+    }
+    fetched = {}
+    if local:
+        mirror = contract_mirror
+        filters.update({
+            "naics_code__prefix": naics_code,
+            "psc_code__prefix": psc_code,
+            "awarding_agency_key": awarding_agency_key,
+            "awardee_uei": awardee_uei,
+        })
+    else:
+        if not any([naics_code, psc_code, awarding_agency_key, awardee_uei]):
+            return {"error": "At least one of naics_code, psc_code, awarding_agency_key or awardee_uei is required"}
+        # Load the fetched award set into a throwaway in-memory mirror and aggregate there
+        mirror = RecordMirror(":memory:", contract_mirror.table, contract_mirror.key, contract_mirror.columns)
+        params = {
+            "naics_code": naics_code,
+            "psc_code": psc_code,
+            "awarding_agency_key": awarding_agency_key,
+            "awardee_uei": awardee_uei,
+        }
+        max_records = max(1, min(max_records, FETCH_ALL_MAX_RECORDS))
+        loaded = total_count = 0
+        budget_truncated = False
+        try:
+            async for page in iter_pages("contract", params, max_records):
+                total_count = page.get("meta", {}).get("total_count", 0)
+                results = page.get("results", [])[:max_records - loaded]
+                loaded += len(results)
+                await asyncio.to_thread(mirror.upsert, [contract_row(c) for c in results])
+                await report_progress(loaded, min(total_count, max_records))
+                if page.get("budget_truncated"):
+                    budget_truncated = loaded < min(total_count, max_records)
+                    break
+                if loaded >= max_records:
+                    break
+        except QuotaExceededError:
+            if not loaded:
+                mirror.close()
+                raise
+            budget_truncated = True
+        fetched = {
+            "total_count": total_count,
+            "fetched": loaded,
+            "truncated": budget_truncated or total_count > max_records,
+        }
+        if budget_truncated:
+            fetched["budget_truncated"] = True
+
+    try:
+        summary = await asyncio.to_thread(mirror.aggregate, filters, CONTRACT_GROUPS[group_by], metric, min(top_n, 100))
+    finally:
+        if mirror is not contract_mirror:
+            mirror.close()
+    return {"group_by": group_by, "metric": metric, "source": "local" if local else "api", **fetched, **summary}
+
+
+GRANT_FIELDS = {
+    "grant_key": "grant_key",
+    "award_id": "award_id",
+    "title": "title",
+    "awarding_agency": Nested("awarding_agency", "agency_name"),
+    "awardee_name": Nested("awardee", "clean_name"),
+    "awardee_uei": Nested("awardee", "uei"),
+    "obligated_amount": "obligated_amount",
+    "start_date": "period_of_performance_start_date",
+    "end_date": "period_of_performance_current_end_date",
+    "cfda_number": "cfda_program_number",
+    "cfda_title": "cfda_program_title",
+    "place_of_performance_state": "place_of_performance_state",
+    "last_modified_date": "last_modified_date",
+    "highergov_url": "path",
+}
+GrantRecord = record_model("GrantRecord", GRANT_FIELDS, "A normalized grant award from the API.")
+grant_record = build_projector(GRANT_FIELDS, "grant_record", "Normalize a raw grant award from the API.", model=GrantRecord)
+
+
+grant_row = build_projector(
+    {
+        **GRANT_FIELDS,
+        "awarding_agency_key": Nested("awarding_agency", "agency_key"),
+        "awardee_key": Nested("awardee", "awardee_key"),
+    },
+    "grant_row",
+    "Flatten a raw grant award into a grant mirror row.",
+)
+
+
+grant_mirror = RecordMirror(
+    MIRROR_DB_PATH,
+    "grants",
+    "grant_key",
+    {
+        "award_id": "TEXT",
+        "title": "TEXT",
+        "awarding_agency": "TEXT",
+        "awarding_agency_key": "INTEGER",
+        "awardee_name": "TEXT",
+        "awardee_uei": "TEXT",
+        "awardee_key": "INTEGER",
+        "obligated_amount": "REAL",
+        "start_date": "TEXT",
+        "end_date": "TEXT",
+        "cfda_number": "TEXT",
+        "cfda_title": "TEXT",
+        "place_of_performance_state": "TEXT",
+        "last_modified_date": "TEXT",
+        "highergov_url": "TEXT",
+    },
+    indexes=("cfda_number", "awardee_uei", "place_of_performance_state", "start_date", "last_modified_date"),
+)
+
+
 @mcp.tool
 async def search_grants(
     awardee_key: int | None = None,
@@ -223,6 +2322,17 @@ async def search_grants(
     ordering: str | None = None,
     page_number: int = 1,
     page_size: int = 25,
+    fetch_all: bool = False,
+    max_records: int = 1000,
+    local: bool = False,
+    min_amount: float | None = None,
+    max_amount: float | None = None,
+    state: str | None = None,
+    start_date_from: str | None = None,
+    start_date_to: str | None = None,
+    end_date_from: str | None = None,
+    end_date_to: str | None = None,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Search federal grant awards (4M+ records). Updated daily.
@@ -239,14 +2349,59 @@ async def search_grants(
         ordering: Sort order
         page_number: Page number
         page_size: Results per page (max 100)
+        fetch_all: Walk all pages server-side in one call (ignores page_number/page_size)
+        max_records: Stop after this many records when fetch_all is set (default 1000)
+        local: Query the local grant mirror instead of the API (no quota used; search_id
+            is not supported). The filters below only work locally.
+        min_amount: Minimum obligated amount
+        max_amount: Maximum obligated amount
+        state: Place of performance state (e.g. "VA")
+        start_date_from: Earliest period of performance start date (YYYY-MM-DD)
+        start_date_to: Latest period of performance start date (YYYY-MM-DD)
+        end_date_from: Earliest period of performance end date (YYYY-MM-DD)
+        end_date_to: Latest period of performance end date (YYYY-MM-DD)
+        fields: Only return these fields of each record (e.g. ["award_id", "awardee_name", "cfda_number"])
 
     Returns:
         Paginated list of grant awards
     """
+    local_filters = {
+        "obligated_amount__gte": min_amount,
+        "obligated_amount__lte": max_amount,
+        "place_of_performance_state": state,
+        "start_date__gte": start_date_from,
+        "start_date__lte": start_date_to,
+        "end_date__gte": end_date_from,
+        "end_date__lte": end_date_to,
+    }
+    has_local_filters = any(value is not None for value in local_filters.values())
+
+    if local:
+        if search_id:
+            return {"error": "search_id is not supported for local search", "grants": []}
+        total, grants = await asyncio.to_thread(
+            grant_mirror.query,
+            {
+                **local_filters,
+                "awardee_key": awardee_key,
+                "awardee_uei": awardee_uei,
+                "cfda_number": cfda_program_number,
+                "awarding_agency_key": awarding_agency_key,
+                "last_modified_date": last_modified_date,
+            },
+            ordering or "-last_modified_date",
+            page_size,
+            (page_number - 1) * page_size,
+        )
+        grants = [select_fields(g, fields) for g in grants]
+        return {"total_count": total, "page": page_number, "source": "local", "grants": grants}
+
+    if has_local_filters:
+        return {"error": "Amount, state and date range filters require local=True", "grants": []}
     if not any([awardee_key, awardee_uei, cfda_program_number, awarding_agency_key, search_id, last_modified_date]):
         return {"error": "At least one filter parameter is required", "grants": []}
 
-    data = await hg_get("grant", {
+    params = {
         "awardee_key": awardee_key,
         "awardee_uei": awardee_uei,
         "cfda_program_number": cfda_program_number,
@@ -254,31 +2409,19 @@ async def search_grants(
         "search_id": search_id,
         "last_modified_date": last_modified_date,
         "ordering": ordering or "-last_modified_date",
+    }
+
+    if fetch_all:
+        return await fetch_all_records("grant", params, with_fields(grant_record, fields), max_records, "grants")
+
+    data = await hg_get("grant", {
+        **params,
         "page_number": page_number,
         "page_size": min(page_size, 100),
     })
 
-    grants = []
-    for g in data.get("results", []):
-        awardee = g.get("awardee") or {}
-        agency = g.get("awarding_agency") or {}
-
-        grants.append({
-            "grant_key": g.get("grant_key"),
-            "award_id": g.get("award_id"),
-            "title": g.get("title"),
-            "awarding_agency": agency.get("agency_name"),
-            "awardee_name": awardee.get("clean_name"),
-            "awardee_uei": awardee.get("uei"),
-            "obligated_amount": g.get("obligated_amount"),
-            "start_date": g.get("period_of_performance_start_date"),
-            "end_date": g.get("period_of_performance_current_end_date"),
-            "cfda_number": g.get("cfda_program_number"),
-            "cfda_title": g.get("cfda_program_title"),
-            "place_of_performance_state": g.get("place_of_performance_state"),
-            "last_modified_date": g.get("last_modified_date"),
-            "highergov_url": g.get("path"),
-        })
+    record = with_fields(grant_record, fields)
+    grants = [record(g) for g in data.get("results", [])]
 
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
@@ -287,6 +2430,47 @@ async def search_grants(
     }
 
 
+AWARDEE_FIELDS = {
+    "awardee_key": "awardee_key",
+    "name": "clean_name",
+    "legal_name": "legal_business_name",
+    "dba_name": "dba_name",
+    "division_name": "division_name",
+    "cage_code": "cage_code",
+    "uei": "uei",
+    "address": AWARDEE_ADDRESS,
+    "website": "website",
+    "year_founded": "year_founded",
+    "employee_count": "employee_count",
+    "primary_naics": Nested("primary_naics", "naics_code", flat=True),
+    "naics_codes": Each("naics_codes", "naics_code"),
+    "psc_codes": Each("psc_codes", "psc_code"),
+    "certifications": certification_list,
+    "parent_company": When("awardee_key_parent", {
+        "awardee_key": Nested("awardee_key_parent", "awardee_key"),
+        "name": Nested("awardee_key_parent", "clean_name"),
+    }),
+    "registration": {
+        "status": "purpose_of_registration",
+        "initial_date": "initial_registration_date",
+        "expiration_date": "registration_expiration_date",
+        "last_update": "registration_last_update_date",
+        "sam_extract_code": "sam_extract_code",
+    },
+    "govt_poc": {
+        "name": poc_name,
+        "title": "govt_bus_poc_title",
+        "phone": "govt_bus_poc_phone",
+        "email": "govt_bus_poc_email",
+    },
+    "highergov_url": "path",
+}
+AwardeeRecord = record_model("AwardeeRecord", AWARDEE_FIELDS, "A normalized awardee from the API (search results).")
+awardee_record = build_projector(
+    AWARDEE_FIELDS, "awardee_record", "Normalize a raw awardee from the API for search results.", model=AwardeeRecord
+)
+
+
 @mcp.tool
 async def search_awardees(
     cage_code: str | None = None,
@@ -297,6 +2481,9 @@ async def search_awardees(
     ordering: str | None = None,
     page_number: int = 1,
     page_size: int = 25,
+    fetch_all: bool = False,
+    max_records: int = 1000,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Search government contractors/awardees (1.5M+ SAM registrants). Updated monthly.
@@ -310,81 +2497,34 @@ async def search_awardees(
         ordering: Sort order (-last_update_date, last_update_date)
         page_number: Page number
         page_size: Results per page (max 100)
+        fetch_all: Walk all pages server-side in one call (ignores page_number/page_size)
+        max_records: Stop after this many records when fetch_all is set (default 1000)
+        fields: Only return these fields of each record (e.g. ["name", "uei", "certifications"]);
+            use "block.key" for one key of a nested block (e.g. "address.state")
 
     Returns:
         Paginated list of awardees/contractors with certifications and business types
     """
-    data = await hg_get("awardee", {
+    params = {
         "cage_code": cage_code,
         "uei": uei,
         "awardee_key_parent": awardee_key_parent,
         "primary_naics": primary_naics,
         "registration_last_update_date": registration_last_update_date,
         "ordering": ordering,
+    }
+
+    if fetch_all:
+        return await fetch_all_records("awardee", params, with_fields(awardee_record, fields), max_records, "awardees")
+
+    data = await hg_get("awardee", {
+        **params,
         "page_number": page_number,
         "page_size": min(page_size, 100),
     })
 
-    awardees = []
-    for a in data.get("results", []):
-        primary_naics_obj = a.get("primary_naics") or {}
-        naics_list = a.get("naics_codes") or []
-        psc_list = a.get("psc_codes") or []
-        bus_type_info = a.get("bus_type_info") or []
-        parent = a.get("awardee_key_parent") or {}
-
-        # Extract certification info with SBA-certified flag
-        certifications = []
-        for bt in bus_type_info:
-            if isinstance(bt, dict):
-                certifications.append({
-                    "type": bt.get("bus_type"),
-                    "description": bt.get("bus_type_description"),
-                    "sba_certified": bt.get("cert_flag", False),
-                })
-
-        awardees.append({
-            "awardee_key": a.get("awardee_key"),
-            "name": a.get("clean_name"),
-            "legal_name": a.get("legal_business_name"),
-            "dba_name": a.get("dba_name"),
-            "division_name": a.get("division_name"),
-            "cage_code": a.get("cage_code"),
-            "uei": a.get("uei"),
-            "address": {
-                "line1": a.get("physical_address_line_1"),
-                "line2": a.get("physical_address_line_2"),
-                "city": a.get("physical_address_city"),
-                "state": a.get("physical_address_province_or_state"),
-                "zip": a.get("physical_address_zip_postal_code"),
-                "country": a.get("physical_address_country_code"),
-            },
-            "website": a.get("website"),
-            "year_founded": a.get("year_founded"),
-            "employee_count": a.get("employee_count"),
-            "primary_naics": primary_naics_obj.get("naics_code") if isinstance(primary_naics_obj, dict) else primary_naics_obj,
-            "naics_codes": [n.get("naics_code") if isinstance(n, dict) else n for n in naics_list],
-            "psc_codes": [p.get("psc_code") if isinstance(p, dict) else p for p in psc_list],
-            "certifications": certifications,
-            "parent_company": {
-                "awardee_key": parent.get("awardee_key") if isinstance(parent, dict) else None,
-                "name": parent.get("clean_name") if isinstance(parent, dict) else None,
-            } if parent else None,
-            "registration": {
-                "status": a.get("purpose_of_registration"),
-                "initial_date": a.get("initial_registration_date"),
-                "expiration_date": a.get("registration_expiration_date"),
-                "last_update": a.get("registration_last_update_date"),
-                "sam_extract_code": a.get("sam_extract_code"),
-            },
-            "govt_poc": {
-                "name": f"{a.get('govt_bus_poc_first_name', '')} {a.get('govt_bus_poc_last_name', '')}".strip() or None,
-                "title": a.get("govt_bus_poc_title"),
-                "phone": a.get("govt_bus_poc_phone"),
-                "email": a.get("govt_bus_poc_email"),
-            },
-            "highergov_url": a.get("path"),
-        })
+    record = with_fields(awardee_record, fields)
+    awardees = [record(a) for a in data.get("results", [])]
 
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
@@ -393,11 +2533,74 @@ async def search_awardees(
     }
 
 
+awardee_detail_record = build_projector(
+    {
+        "awardee_key": "awardee_key",
+        "name": "clean_name",
+        "legal_name": "legal_business_name",
+        "dba_name": "dba_name",
+        "division_name": "division_name",
+        "cage_code": "cage_code",
+        "uei": "uei",
+        "duns": "duns",
+        "address": AWARDEE_ADDRESS,
+        "mailing_address": {
+            "line1": "mailing_address_line_1",
+            "line2": "mailing_address_line_2",
+            "city": "mailing_address_city",
+            "state": "mailing_address_province_or_state",
+            "zip": "mailing_address_zip_postal_code",
+            "country": "mailing_address_country_code",
+        },
+        "website": "website",
+        "company_info": {
+            "year_founded": "year_founded",
+            "employee_count": "employee_count",
+            "entity_type": "entity_type",
+            "organization_type": "organization_type",
+            "state_of_incorporation": "state_of_incorporation",
+            "country_of_incorporation": "country_of_incorporation",
+        },
+        "naics_codes": {
+            "primary": Nested("primary_naics", "naics_code", flat=True),
+            "primary_description": Nested("primary_naics", "naics_title"),
+            "all_codes": Each("naics_codes", "naics_code"),
+        },
+        "psc_codes": Each("psc_codes", "psc_code"),
+        "certifications": certification_summary,
+        "parent_company": When("awardee_key_parent", {
+            "awardee_key": Nested("awardee_key_parent", "awardee_key"),
+            "name": Nested("awardee_key_parent", "clean_name"),
+            "cage_code": Nested("awardee_key_parent", "cage_code"),
+        }),
+        "registration": {
+            "purpose": "purpose_of_registration",
+            "initial_date": "initial_registration_date",
+            "activation_date": "activation_date",
+            "expiration_date": "registration_expiration_date",
+            "last_update": "registration_last_update_date",
+            "sam_extract_code": "sam_extract_code",
+        },
+        "govt_business_poc": {
+            "first_name": "govt_bus_poc_first_name",
+            "last_name": "govt_bus_poc_last_name",
+            "title": "govt_bus_poc_title",
+            "phone": "govt_bus_poc_phone",
+            "email": "govt_bus_poc_email",
+        },
+        "highergov_url": "path",
+    },
+    "awardee_detail_record",
+    "Normalize a raw awardee from the API with every detail block.",
+)
+
+
 @mcp.tool
 async def get_awardee_details(
     awardee_key: int | None = None,
     cage_code: str | None = None,
     uei: str | None = None,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Get comprehensive details for a specific awardee/contractor.
@@ -407,6 +2610,8 @@ async def get_awardee_details(
         awardee_key: HigherGov awardee key (preferred - most precise)
         cage_code: CAGE code
         uei: Unique Entity Identifier
+        fields: Only return these fields of the record (e.g. ["name", "uei", "certifications"]);
+            use "block.key" for one key of a nested block (e.g. "company_info.employee_count")
 
     Returns:
         Full entity details including all certifications, codes, contacts, and business info
@@ -425,156 +2630,302 @@ async def get_awardee_details(
     if not results:
         return {"error": "Awardee not found", "awardee": None}
 
-    a = results[0]
-    primary_naics_obj = a.get("primary_naics") or {}
-    naics_list = a.get("naics_codes") or []
-    psc_list = a.get("psc_codes") or []
-    bus_type_info = a.get("bus_type_info") or []
-    parent = a.get("awardee_key_parent") or {}
-
-    # Extract all certifications with SBA-certified flag
-    certifications = []
-    sba_certified_types = []
-    self_certified_types = []
-    for bt in bus_type_info:
-        if isinstance(bt, dict):
-            cert = {
-                "type": bt.get("bus_type"),
-                "description": bt.get("bus_type_description"),
-                "sba_certified": bt.get("cert_flag", False),
-            }
-            certifications.append(cert)
-            if bt.get("cert_flag"):
-                sba_certified_types.append(bt.get("bus_type_description"))
-            else:
-                self_certified_types.append(bt.get("bus_type_description"))
+    return {"awardee": select_fields(awardee_detail_record(results[0]), fields)}
+
+
+@mcp.tool
+async def get_awardee_details_batch(
+    awardee_keys: list[int] | None = None,
+    ueis: list[str] | None = None,
+    cage_codes: list[str] | None = None,
+    fields: list[str] | None = None,
+) -> dict:
+    """
+    Get comprehensive details for many awardees/contractors in one call.
+    Use this instead of repeated get_awardee_details calls when enriching a list of entities.
+
+    Duplicate identifiers are looked up once; previously fetched entities are served from cache.
+    A failed or missing lookup is reported for that identifier without failing the batch.
 
+    Args:
+        awardee_keys: HigherGov awardee keys
+        ueis: Unique Entity Identifiers
+        cage_codes: CAGE codes
+        fields: Only return these fields of each record (e.g. ["name", "uei"]);
+            use "block.key" for one key of a nested block (e.g. "naics_codes.primary")
+
+    Returns:
+        Entity details keyed by identifier type, then identifier; each entry holds
+        either "awardee" or "error"
+    """
+    lookups = []
+    for field, values in (("awardee_key", awardee_keys), ("uei", ueis), ("cage_code", cage_codes)):
+        seen = set()
+        for value in values or []:
+            value = value if field == "awardee_key" else str(value).strip().upper()
+            if value and value not in seen:
+                seen.add(value)
+                lookups.append((field, value))
+    if not lookups:
+        return {"error": "At least one identifier required: awardee_keys, ueis, or cage_codes"}
+    if len(lookups) > BATCH_MAX_IDENTIFIERS:
+        return {"error": f"At most {BATCH_MAX_IDENTIFIERS} identifiers per batch ({len(lookups)} given)"}
+
+    sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+    record = with_fields(awardee_detail_record, fields)
+    done = 0
+
+    async def lookup(field: str, value) -> dict:
+        nonlocal done
+        async with sem:
+            try:
+                data = await hg_get("awardee", {field: value, "page_size": 1})
+                results = data.get("results", [])
+                entry = {"awardee": record(results[0])} if results else {"error": "Awardee not found"}
+            except httpx.HTTPStatusError as e:
+                entry = {"error": f"HigherGov API returned {e.response.status_code}"}
+            except httpx.HTTPError as e:
+                entry = {"error": f"Request failed: {e.__class__.__name__}"}
+            except QuotaExceededError as e:
+                entry = {"error": str(e)}
+        done += 1
+        await report_progress(done, len(lookups))
+        return entry
+
+    entries = await asyncio.gather(*(lookup(field, value) for field, value in lookups))
+
+    results: dict[str, dict] = {"awardee_key": {}, "uei": {}, "cage_code": {}}
+    for (field, value), entry in zip(lookups, entries):
+        results[field][str(value)] = entry
+    found = sum(1 for entry in entries if "awardee" in entry)
     return {
-        "awardee": {
-            "awardee_key": a.get("awardee_key"),
-            "name": a.get("clean_name"),
-            "legal_name": a.get("legal_business_name"),
-            "dba_name": a.get("dba_name"),
-            "division_name": a.get("division_name"),
-            "cage_code": a.get("cage_code"),
-            "uei": a.get("uei"),
-            "duns": a.get("duns"),
-            "address": {
-                "line1": a.get("physical_address_line_1"),
-                "line2": a.get("physical_address_line_2"),
-                "city": a.get("physical_address_city"),
-                "state": a.get("physical_address_province_or_state"),
-                "zip": a.get("physical_address_zip_postal_code"),
-                "country": a.get("physical_address_country_code"),
-            },
-            "mailing_address": {
-                "line1": a.get("mailing_address_line_1"),
-                "line2": a.get("mailing_address_line_2"),
-                "city": a.get("mailing_address_city"),
-                "state": a.get("mailing_address_province_or_state"),
-                "zip": a.get("mailing_address_zip_postal_code"),
-                "country": a.get("mailing_address_country_code"),
-            },
-            "website": a.get("website"),
-            "company_info": {
-                "year_founded": a.get("year_founded"),
-                "employee_count": a.get("employee_count"),
-                "entity_type": a.get("entity_type"),
-                "organization_type": a.get("organization_type"),
-                "state_of_incorporation": a.get("state_of_incorporation"),
-                "country_of_incorporation": a.get("country_of_incorporation"),
-            },
-            "naics_codes": {
-                "primary": primary_naics_obj.get("naics_code") if isinstance(primary_naics_obj, dict) else primary_naics_obj,
-                "primary_description": primary_naics_obj.get("naics_title") if isinstance(primary_naics_obj, dict) else None,
-                "all_codes": [n.get("naics_code") if isinstance(n, dict) else n for n in naics_list],
-            },
-            "psc_codes": [p.get("psc_code") if isinstance(p, dict) else p for p in psc_list],
-            "certifications": {
-                "all": certifications,
-                "sba_certified": sba_certified_types,
-                "self_certified": self_certified_types,
-            },
-            "parent_company": {
-                "awardee_key": parent.get("awardee_key") if isinstance(parent, dict) else None,
-                "name": parent.get("clean_name") if isinstance(parent, dict) else None,
-                "cage_code": parent.get("cage_code") if isinstance(parent, dict) else None,
-            } if parent else None,
-            "registration": {
-                "purpose": a.get("purpose_of_registration"),
-                "initial_date": a.get("initial_registration_date"),
-                "activation_date": a.get("activation_date"),
-                "expiration_date": a.get("registration_expiration_date"),
-                "last_update": a.get("registration_last_update_date"),
-                "sam_extract_code": a.get("sam_extract_code"),
-            },
-            "govt_business_poc": {
-                "first_name": a.get("govt_bus_poc_first_name"),
-                "last_name": a.get("govt_bus_poc_last_name"),
-                "title": a.get("govt_bus_poc_title"),
-                "phone": a.get("govt_bus_poc_phone"),
-                "email": a.get("govt_bus_poc_email"),
-            },
-            "highergov_url": a.get("path"),
-        }
+        "requested": len(lookups),
+        "found": found,
+        "errors": len(lookups) - found,
+        "results": {field: items for field, items in results.items() if items},
     }
 
 
+AWARDEE_NAME_FIELDS = {
+    "awardee_key": "awardee_key",
+    "name": "clean_name",
+    "legal_name": "legal_business_name",
+    "cage_code": "cage_code",
+    "uei": "uei",
+    "city": "physical_address_city",
+    "state": "physical_address_province_or_state",
+    "employee_count": "employee_count",
+    "certifications": certification_descriptions,
+    "highergov_url": "path",
+}
+awardee_name_record = build_projector(
+    AWARDEE_NAME_FIELDS, "awardee_name_record", "Normalize a raw awardee for name search results."
+)
+
+
+awardee_row = build_projector(
+    {
+        **AWARDEE_NAME_FIELDS,
+        "certifications": lambda a: json.dumps(certification_descriptions(a)),
+        "dba_name": "dba_name",
+        "primary_naics": Nested("primary_naics", "naics_code", flat=True),
+        "registration_last_update_date": "registration_last_update_date",
+    },
+    "awardee_row",
+    "Flatten a raw awardee into an awardee registry row.",
+)
+
+
+class AwardeeRegistry(RecordMirror):
+    """
+    Awardee mirror with a trigram index over clean, legal and DBA names.
+
+    Trigram matches select candidates (so misspellings and partial names still hit);
+    candidates are then ranked by similarity of the closest name to the query.
+    """
+
+    MAX_CANDIDATES = 200
+    MIN_SCORE = 0.5
+
+    def __init__(self, path: str):
+        super().__init__(
+            path,
+            "awardees",
+            "awardee_key",
+            {
+                "name": "TEXT",
+                "legal_name": "TEXT",
+                "dba_name": "TEXT",
+                "cage_code": "TEXT",
+                "uei": "TEXT",
+                "city": "TEXT",
+                "state": "TEXT",
+                "employee_count": "INTEGER",
+                "certifications": "TEXT",
+                "primary_naics": "TEXT",
+                "registration_last_update_date": "TEXT",
+                "highergov_url": "TEXT",
+            },
+            indexes=("uei", "cage_code", "name"),
+            date_field="registration_last_update_date",
+            key_type="INTEGER",
+        )
+        self.schema = (
+            *self.schema,
+            "CREATE VIRTUAL TABLE IF NOT EXISTS awardees_fts USING fts5("
+            "awardee_key UNINDEXED, name, legal_name, dba_name, tokenize='trigram')",
+        )
+
+    def upsert(self, rows: list[dict]) -> int:
+        written = super().upsert(rows)
+        rows = [row for row in rows if row.get(self.key)]
+        if rows:
+            keys = [row[self.key] for row in rows]
+            with self.transaction() as conn:
+                conn.execute(f"DELETE FROM awardees_fts WHERE awardee_key IN ({','.join('?' * len(keys))})", keys)
+                conn.executemany(
+                    "INSERT INTO awardees_fts (awardee_key, name, legal_name, dba_name) VALUES (?, ?, ?, ?)",
+                    [(row[self.key], row.get("name"), row.get("legal_name"), row.get("dba_name")) for row in rows],
+                )
+        return written
+
+    def complete(self) -> bool:
+        """Whether the "all" scope has synced with no day cut off, so every registrant is held."""
+        return self.get_state(f"{self.table}:all") is not None and not self.states(f"{self.table}:truncated:all:")
+
+    def search_names(self, query: str, limit: int, offset: int = 0) -> tuple[int, list[dict]]:
+        """Return (total ranked matches, one page of awardees) for a fuzzy name query."""
+        needle = " ".join(query.lower().split())
+        if len(needle) < 3:
+            # Too short for trigrams: fall back to a name prefix scan
+            clause, args = "WHERE name LIKE ?", [f"{needle}%"]
+        else:
+            trigrams = {needle[i:i + 3] for i in range(len(needle) - 2)}
+            match = " OR ".join('"' + trigram.replace('"', '""') + '"' for trigram in sorted(trigrams))
+            clause = (
+                f"WHERE awardee_key IN (SELECT awardee_key FROM awardees_fts WHERE awardees_fts MATCH ? "
+                f"ORDER BY bm25(awardees_fts) LIMIT {self.MAX_CANDIDATES})"
+            )
+            args = [match]
+        names = [self.key, *self.columns]
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                f"SELECT {', '.join(names)} FROM {self.table} {clause} LIMIT {self.MAX_CANDIDATES}", args
+            ).fetchall()
+        ranked = []
+        for row in rows:
+            record = dict(zip(names, row))
+            score = max(
+                (self.similarity(needle, candidate.lower())
+                 for candidate in (record["name"], record["legal_name"], record["dba_name"]) if candidate),
+                default=0.0,
+            )
+            if score >= self.MIN_SCORE:
+                record["certifications"] = json.loads(record["certifications"] or "[]")
+                for column in ("dba_name", "primary_naics", "registration_last_update_date"):
+                    del record[column]
+                ranked.append((score, record))
+        ranked.sort(key=lambda item: (-item[0], item[1]["name"] or ""))
+        return len(ranked), [{**record, "score": round(score, 3)} for score, record in ranked[offset:offset + limit]]
+
+    @staticmethod
+    def similarity(needle: str, name: str) -> float:
+        """Score a name against the query: prefix and substring hits rank above fuzzy ones."""
+        if name.startswith(needle):
+            return 1.0
+        if needle in name:
+            return 0.9
+        return SequenceMatcher(None, needle, name).ratio()
+
+
+awardee_registry = AwardeeRegistry(MIRROR_DB_PATH)
+
+
 @mcp.tool
 async def search_awardees_by_name(
     name: str,
     page_number: int = 1,
     page_size: int = 25,
+    local: bool = True,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Search for contractors/awardees by company name.
     Returns matching companies with key identifiers and certifications.
 
+    Matches come from the local awardee registry (fuzzy, ranked by name similarity)
+    only when it holds every registrant, i.e. the "all" awardee mirror scope has
+    synced. Otherwise the API is queried and its total_count reported, since a
+    registry holding a narrower scope or previously seen pages would return a subset
+    of the matches.
+
     Args:
         name: Company name to search (partial match supported)
         page_number: Page number
         page_size: Results per page (max 100)
+        local: Use the local awardee registry when it is complete (default True)
+        fields: Only return these fields of each record (e.g. ["name", "uei", "state"])
 
     Returns:
         List of matching awardees with basic info
     """
+    page_size = min(page_size, 100)
+    total = 0
+    if local and ("", "") in AWARDEE_MIRROR_SCOPES:
+        try:
+            if await asyncio.to_thread(awardee_registry.complete):
+                total, awardees = await asyncio.to_thread(
+                    awardee_registry.search_names, name, page_size, (page_number - 1) * page_size
+                )
+        except (sqlite3.Error, OSError):
+            # The registry cannot be opened (e.g. unwritable data dir); ask the API
+            total = 0
+    if total:
+        awardees = [select_fields(a, fields) for a in awardees]
+        return {"total_count": total, "page": page_number, "source": "local", "awardees": awardees}
+
     data = await hg_get("awardee", {
         "clean_name": name,
         "page_number": page_number,
-        "page_size": min(page_size, 100),
+        "page_size": page_size,
     })
-
-    awardees = []
-    for a in data.get("results", []):
-        bus_type_info = a.get("bus_type_info") or []
-        cert_types = [bt.get("bus_type_description") for bt in bus_type_info if isinstance(bt, dict)]
-
-        awardees.append({
-            "awardee_key": a.get("awardee_key"),
-            "name": a.get("clean_name"),
-            "legal_name": a.get("legal_business_name"),
-            "cage_code": a.get("cage_code"),
-            "uei": a.get("uei"),
-            "city": a.get("physical_address_city"),
-            "state": a.get("physical_address_province_or_state"),
-            "employee_count": a.get("employee_count"),
-            "certifications": cert_types,
-            "highergov_url": a.get("path"),
-        })
+    results = data.get("results", [])
+    # Keep what the API found so the next lookup of this name is local
+    try:
+        await asyncio.to_thread(awardee_registry.upsert, [awardee_row(a) for a in results])
+    except (sqlite3.Error, OSError):
+        pass
 
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
         "page": page_number,
-        "awardees": awardees,
+        "source": "api",
+        "awardees": [select_fields(awardee_name_record(a), fields) for a in results],
     }
 
 
+awardee_certification_record = build_projector(
+    {
+        "awardee_key": "awardee_key",
+        "name": "clean_name",
+        "cage_code": "cage_code",
+        "uei": "uei",
+        "certifications": certification_counts,
+        "highergov_url": "path",
+    },
+    "awardee_certification_record",
+    "Normalize a raw awardee for certification lookups.",
+)
+
+
 @mcp.tool
 async def get_awardee_certifications(
     cage_code: str | None = None,
     uei: str | None = None,
     primary_naics: str | None = None,
     page_size: int = 25,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Get awardee small business certifications with SBA-certified vs self-certified distinction.
@@ -592,6 +2943,8 @@ async def get_awardee_certifications(
         cage_code: CAGE code
         uei: Unique Entity Identifier
         primary_naics: Primary NAICS code
+        fields: Only return these fields of each record (e.g. ["name", "uei"]);
+            use "block.key" for one key of a nested block (e.g. "certifications.sba_certified")
 
     Returns:
         Awardees with detailed certification info including SBA-certified flag
@@ -603,53 +2956,38 @@ async def get_awardee_certifications(
         "page_size": min(page_size, 100),
     })
 
-    awardees = []
-    for a in data.get("results", []):
-        bus_type_info = a.get("bus_type_info") or []
-
-        # Parse certifications with SBA-certified flag
-        all_certs = []
-        sba_certified = []
-        self_certified = []
-        for bt in bus_type_info:
-            if isinstance(bt, dict):
-                cert = {
-                    "type": bt.get("bus_type"),
-                    "description": bt.get("bus_type_description"),
-                    "sba_certified": bt.get("cert_flag", False),
-                }
-                all_certs.append(cert)
-                if bt.get("cert_flag"):
-                    sba_certified.append(bt.get("bus_type_description"))
-                else:
-                    self_certified.append(bt.get("bus_type_description"))
-
-        awardees.append({
-            "awardee_key": a.get("awardee_key"),
-            "name": a.get("clean_name"),
-            "cage_code": a.get("cage_code"),
-            "uei": a.get("uei"),
-            "certifications": {
-                "all": all_certs,
-                "sba_certified": sba_certified,
-                "self_certified": self_certified,
-                "count": len(all_certs),
-            },
-            "highergov_url": a.get("path"),
-        })
-
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
-        "awardees": awardees,
+        "awardees": [select_fields(awardee_certification_record(a), fields) for a in data.get("results", [])],
     }
 
 
+person_record = build_projector(
+    {
+        "person_key": "person_key",
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "title": "title",
+        "agency": Nested("agency", "agency_name", flat=True),
+        "agency_key": Nested("agency", "agency_key"),
+        "email": "email",
+        "phone": "phone",
+        "highergov_url": "path",
+    },
+    "person_record",
+    "Normalize a raw government contact from the API.",
+)
+
+
 @mcp.tool
 async def search_people(
     last_name: str | None = None,
     agency_key: int | None = None,
     page_number: int = 1,
     page_size: int = 25,
+    fetch_all: bool = False,
+    max_records: int = 1000,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Search government contacts and personnel (130K+ records).
@@ -660,31 +2998,29 @@ async def search_people(
         agency_key: HigherGov agency key to filter by agency
         page_number: Page number
         page_size: Results per page (max 100)
+        fetch_all: Walk all pages server-side in one call (ignores page_number/page_size)
+        max_records: Stop after this many records when fetch_all is set (default 1000)
+        fields: Only return these fields of each record (e.g. ["first_name", "last_name", "email"])
 
     Returns:
         List of government contacts with their agency and contact info
     """
-    data = await hg_get("people", {
+    params = {
         "last_name": last_name,
         "agency_key": agency_key,
+    }
+
+    if fetch_all:
+        return await fetch_all_records("people", params, with_fields(person_record, fields), max_records, "people")
+
+    data = await hg_get("people", {
+        **params,
         "page_number": page_number,
         "page_size": min(page_size, 100),
     })
 
-    people = []
-    for p in data.get("results", []):
-        agency = p.get("agency") or {}
-        people.append({
-            "person_key": p.get("person_key"),
-            "first_name": p.get("first_name"),
-            "last_name": p.get("last_name"),
-            "title": p.get("title"),
-            "agency": agency.get("agency_name") if isinstance(agency, dict) else agency,
-            "agency_key": agency.get("agency_key") if isinstance(agency, dict) else None,
-            "email": p.get("email"),
-            "phone": p.get("phone"),
-            "highergov_url": p.get("path"),
-        })
+    record = with_fields(person_record, fields)
+    people = [record(p) for p in data.get("results", [])]
 
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
@@ -693,6 +3029,22 @@ async def search_people(
     }
 
 
+vehicle_record = build_projector(
+    {
+        "vehicle_key": "vehicle_key",
+        "name": "vehicle_name",
+        "abbreviation": "abbreviation",
+        "agency": Nested("agency", "agency_name", flat=True),
+        "vehicle_type": "vehicle_type",
+        "ordering_start_date": "ordering_start_date",
+        "ordering_end_date": "ordering_end_date",
+        "highergov_url": "path",
+    },
+    "vehicle_record",
+    "Normalize a raw contract vehicle from the API.",
+)
+
+
 @mcp.tool
 async def search_contract_vehicles(
     vehicle_name: str | None = None,
@@ -700,6 +3052,9 @@ async def search_contract_vehicles(
     naics_code: str | None = None,
     page_number: int = 1,
     page_size: int = 25,
+    fetch_all: bool = False,
+    max_records: int = 1000,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Search government contract vehicles (GWACs, BPAs, IDIQs, GSA Schedules).
@@ -711,31 +3066,32 @@ async def search_contract_vehicles(
         naics_code: NAICS code supported by vehicle
         page_number: Page number
         page_size: Results per page (max 100)
+        fetch_all: Walk all pages server-side in one call (ignores page_number/page_size)
+        max_records: Stop after this many records when fetch_all is set (default 1000)
+        fields: Only return these fields of each record (e.g. ["name", "vehicle_type", "ordering_end_date"])
 
     Returns:
         List of contract vehicles with holder information
     """
-    data = await hg_get("contract_vehicle", {
+    params = {
         "vehicle_name": vehicle_name,
         "agency_key": agency_key,
         "naics_code": naics_code,
+    }
+
+    if fetch_all:
+        return await fetch_all_records(
+            "contract_vehicle", params, with_fields(vehicle_record, fields), max_records, "vehicles"
+        )
+
+    data = await hg_get("contract_vehicle", {
+        **params,
         "page_number": page_number,
         "page_size": min(page_size, 100),
     })
 
-    vehicles = []
-    for v in data.get("results", []):
-        agency = v.get("agency") or {}
-        vehicles.append({
-            "vehicle_key": v.get("vehicle_key"),
-            "name": v.get("vehicle_name"),
-            "abbreviation": v.get("abbreviation"),
-            "agency": agency.get("agency_name") if isinstance(agency, dict) else agency,
-            "vehicle_type": v.get("vehicle_type"),
-            "ordering_start_date": v.get("ordering_start_date"),
-            "ordering_end_date": v.get("ordering_end_date"),
-            "highergov_url": v.get("path"),
-        })
+    record = with_fields(vehicle_record, fields)
+    vehicles = [record(v) for v in data.get("results", [])]
 
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
@@ -744,11 +3100,27 @@ async def search_contract_vehicles(
     }
 
 
+document_record = build_projector(
+    {
+        "filename": "filename",
+        "file_type": "file_type",
+        "file_size": "file_size",
+        "download_url": "download_url",
+        "note": Const("URL expires in 60 minutes"),
+    },
+    "document_record",
+    "Normalize a raw opportunity document from the API.",
+)
+
+
 @mcp.tool
 async def get_documents(
     related_key: str,
     page_number: int = 1,
     page_size: int = 25,
+    fetch_all: bool = False,
+    max_records: int = 1000,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Get documents associated with an opportunity.
@@ -756,25 +3128,28 @@ async def get_documents(
 
     Args:
         related_key: The source_id_version or document_path from opportunity search
+        fetch_all: Walk all pages server-side in one call (ignores page_number/page_size)
+        max_records: Stop after this many records when fetch_all is set (default 1000)
+        fields: Only return these fields of each record (e.g. ["filename", "download_url"])
 
     Returns:
         List of documents with download URLs (expire in 60 min)
     """
-    data = await hg_get("document", {
+    params = {
         "related_key": related_key,
+    }
+
+    if fetch_all:
+        return await fetch_all_records("document", params, with_fields(document_record, fields), max_records, "documents")
+
+    data = await hg_get("document", {
+        **params,
         "page_number": page_number,
         "page_size": min(page_size, 100),
     })
 
-    documents = []
-    for doc in data.get("results", []):
-        documents.append({
-            "filename": doc.get("filename"),
-            "file_type": doc.get("file_type"),
-            "file_size": doc.get("file_size"),
-            "download_url": doc.get("download_url"),
-            "note": "URL expires in 60 minutes",
-        })
+    record = with_fields(document_record, fields)
+    documents = [record(doc) for doc in data.get("results", [])]
 
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
@@ -782,11 +3157,26 @@ async def get_documents(
     }
 
 
+agency_record = build_projector(
+    {
+        "agency_key": "agency_key",
+        "name": "agency_name",
+        "abbreviation": "agency_abbreviation",
+        "agency_type": "agency_type",
+        "parent_agency": Nested("parent_agency", "agency_name", flat=True),
+        "highergov_url": "path",
+    },
+    "agency_record",
+    "Normalize a raw agency from the API.",
+)
+
+
 @mcp.tool
 async def search_agencies(
     agency_key: int | None = None,
     page_number: int = 1,
     page_size: int = 50,
+    fields: list[str] | None = None,
 ) -> dict:
     """
     Search federal agencies (3K+ records).
@@ -795,6 +3185,7 @@ async def search_agencies(
         agency_key: Specific HigherGov agency key
         page_number: Page number
         page_size: Results per page
+        fields: Only return these fields of each record (e.g. ["agency_key", "name", "abbreviation"])
 
     Returns:
         List of agencies with hierarchy
@@ -805,17 +3196,8 @@ async def search_agencies(
         "page_size": min(page_size, 100),
     })
 
-    agencies = []
-    for a in data.get("results", []):
-        parent = a.get("parent_agency") or {}
-        agencies.append({
-            "agency_key": a.get("agency_key"),
-            "name": a.get("agency_name"),
-            "abbreviation": a.get("agency_abbreviation"),
-            "agency_type": a.get("agency_type"),
-            "parent_agency": parent.get("agency_name") if isinstance(parent, dict) else parent,
-            "highergov_url": a.get("path"),
-        })
+    record = with_fields(agency_record, fields)
+    agencies = [record(a) for a in data.get("results", [])]
 
     return {
         "total_count": data.get("meta", {}).get("total_count", 0),
@@ -823,61 +3205,561 @@ async def search_agencies(
     }
 
 
+def tokenize(text: str | None) -> list[str]:
+    """Split text into lowercase alphanumeric words."""
+    return re.findall(r"[a-z0-9]+", (text or "").lower())
+
+
+class CodeIndex:
+    """
+    In-memory index over a reference code table.
+
+    Codes go into a prefix trie whose nodes list every code beneath them, and
+    description words into an inverted index searched by word prefix.
+    """
+
+    def __init__(self, rows: list[dict], code_field: str, text_field: str):
+        self.rows: dict[str, dict] = {}
+        self._trie: tuple[list[str], dict] = ([], {})
+        self._postings: dict[str, set[str]] = {}
+        for row in rows:
+            code = str(row.get(code_field) or "").strip().upper()
+            if not code or code in self.rows:
+                continue
+            self.rows[code] = row
+            node = self._trie
+            for ch in code:
+                node = node[1].setdefault(ch, ([], {}))
+                node[0].append(code)
+            for word in set(tokenize(row.get(text_field))):
+                self._postings.setdefault(word, set()).add(code)
+        self._words = sorted(self._postings)
+        self._all = sorted(self.rows)
+
+    def prefix(self, prefix: str) -> list[str]:
+        """Return codes starting with `prefix`, in code order."""
+        node = self._trie
+        for ch in prefix.strip().upper():
+            node = node[1].get(ch)
+            if node is None:
+                return []
+        return sorted(node[0]) if node is not self._trie else self._all
+
+    def _words_with_prefix(self, token: str) -> list[str]:
+        i = bisect_left(self._words, token)
+        words = []
+        while i < len(self._words) and self._words[i].startswith(token):
+            words.append(self._words[i])
+            i += 1
+        return words
+
+    def search(self, text: str) -> list[str]:
+        """Return codes whose description contains every query word (as a word prefix)."""
+        matches = None
+        for token in tokenize(text):
+            codes = set()
+            for word in self._words_with_prefix(token):
+                codes |= self._postings[word]
+            matches = codes if matches is None else matches & codes
+            if not matches:
+                return []
+        return sorted(matches) if matches else []
+
+    def rank(self, text: str) -> list[str]:
+        """
+        Return codes matching any query word, best first.
+
+        Each query word scores 1 for an exact word match, 0.75 for a word-prefix
+        match, or 0.5 for a close misspelling when nothing else matches it.
+        """
+        scores: dict[str, float] = {}
+        for token in tokenize(text):
+            hits: dict[str, float] = {}
+            for word in self._words_with_prefix(token):
+                weight = 1.0 if word == token else 0.75
+                for code in self._postings[word]:
+                    hits[code] = max(hits.get(code, 0), weight)
+            if not hits:
+                for word in get_close_matches(token, self._words, n=3, cutoff=0.8):
+                    for code in self._postings[word]:
+                        hits[code] = 0.5
+            for code, weight in hits.items():
+                scores[code] = scores.get(code, 0) + weight
+        return sorted(scores, key=lambda c: (-scores[c], c))
+
+
+async def load_reference_rows(endpoint: str, max_age: float | None = None) -> list[dict]:
+    """
+    Return every row of a reference endpoint, from the on-disk copy while it is fresh.
+
+    The copy is fresh for the endpoint's cache TTL, or for `max_age` seconds if given.
+    Writing the copy is best effort: the downloaded rows are returned even if DATA_DIR
+    is not writable. Raises QuotaExceededError rather than return a table the record
+    budget cut short.
+    """
+    path = os.path.join(DATA_DIR, f"{endpoint}.json")
+    if max_age is None:
+        max_age = CACHE_TTLS.get(endpoint, 0)
+    try:
+        if time.time() - os.path.getmtime(path) < max_age:
+            with open(path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    rows = []
+    # The on-disk copy is this table's cache; once it is stale, skip the response caches too
+    async for page in iter_pages(endpoint, {}, REFERENCE_MAX_RECORDS, fresh=True):
+        if page.get("budget_truncated"):
+            raise QuotaExceededError(f"Record budget too low to download the {endpoint} table")
+        rows.extend(page.get("results", []))
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(rows, f)
+        os.replace(f"{path}.tmp", path)
+    except OSError:
+        pass
+    return rows
+
+
+_code_indexes: dict[str, CodeIndex] = {}
+_code_index_locks: dict[str, asyncio.Lock] = {}
+
+
+REFERENCE_INDEXES = {
+    "naics": ("naics_code", "naics_title"),
+    "psc": ("psc_code", "description"),
+}
+
+
+async def get_code_index(endpoint: str, code_field: str, text_field: str) -> CodeIndex:
+    """Return the local index for a reference endpoint, loading it on first use."""
+    if endpoint not in _code_indexes:
+        async with _code_index_locks.setdefault(endpoint, asyncio.Lock()):
+            if endpoint not in _code_indexes:
+                rows = await load_reference_rows(endpoint)
+                _code_indexes[endpoint] = CodeIndex(rows, code_field, text_field)
+    return _code_indexes[endpoint]
+
+
 @mcp.tool
 async def lookup_naics(
     naics_code: str | None = None,
+    keyword: str | None = None,
     page_size: int = 50,
 ) -> dict:
     """
     Look up NAICS codes and descriptions.
+    Served from a local index of the full NAICS table. The first call downloads the
+    table (about 2K records of quota, once per cache TTL); later lookups use none.
 
     Args:
-        naics_code: NAICS code to look up (partial match supported)
+        naics_code: NAICS code to look up (prefix match, e.g. "5415")
+        keyword: Words to find in NAICS titles (e.g. "cyber", "janitorial")
         page_size: Results per page
 
     Returns:
         List of NAICS codes with titles
     """
-    data = await hg_get("naics", {
-        "naics_code": naics_code,
-        "page_size": min(page_size, 100),
-    })
-
-    codes = []
-    for n in data.get("results", []):
-        codes.append({
-            "naics_code": n.get("naics_code"),
-            "title": n.get("naics_title"),
+    try:
+        index = await get_code_index("naics", *REFERENCE_INDEXES["naics"])
+    except (httpx.HTTPError, OSError, QuotaExceededError):
+        index = None
+
+    if index is None:
+        data = await hg_get("naics", {
+            "naics_code": naics_code,
+            "page_size": min(page_size, 100),
         })
+        codes = []
+        for n in data.get("results", []):
+            codes.append({
+                "naics_code": n.get("naics_code"),
+                "title": n.get("naics_title"),
+            })
+        return {"naics_codes": codes}
+
+    if keyword:
+        matches = index.search(keyword)
+        if naics_code:
+            matches = [c for c in matches if c.startswith(naics_code.strip().upper())]
+    else:
+        matches = index.prefix(naics_code or "")
 
-    return {"naics_codes": codes}
+    return {
+        "total_count": len(matches),
+        "naics_codes": [
+            {"naics_code": index.rows[c].get("naics_code"), "title": index.rows[c].get("naics_title")}
+            for c in matches[:page_size]
+        ],
+    }
 
 
 @mcp.tool
 async def lookup_psc(
     psc_code: str | None = None,
+    keyword: str | None = None,
     page_size: int = 50,
 ) -> dict:
     """
     Look up Product/Service Codes (PSC).
+    Served from a local index of the full PSC table. The first call downloads the
+    table (a few thousand records of quota, once per cache TTL); later lookups use none.
+
+    A code prefix rolls up a whole category or sub-category, e.g. "D3" returns
+    every IT and telecom service code.
 
     Args:
-        psc_code: PSC code to look up (partial match supported)
+        psc_code: PSC code or prefix to look up (e.g. "D3", "R425")
+        keyword: Free-text description search, best matches first (tolerates typos)
         page_size: Results per page
 
     Returns:
         List of PSC codes with descriptions
     """
-    data = await hg_get("psc", {
-        "psc_code": psc_code,
-        "page_size": min(page_size, 100),
-    })
-
-    codes = []
-    for p in data.get("results", []):
-        codes.append({
-            "psc_code": p.get("psc_code"),
-            "description": p.get("description"),
+    try:
+        index = await get_code_index("psc", *REFERENCE_INDEXES["psc"])
+    except (httpx.HTTPError, OSError, QuotaExceededError):
+        index = None
+
+    if index is None:
+        data = await hg_get("psc", {
+            "psc_code": psc_code,
+            "page_size": min(page_size, 100),
         })
+        codes = []
+        for p in data.get("results", []):
+            codes.append({
+                "psc_code": p.get("psc_code"),
+                "description": p.get("description"),
+            })
+        return {"psc_codes": codes}
+
+    if keyword:
+        matches = index.rank(keyword)
+        if psc_code:
+            matches = [c for c in matches if c.startswith(psc_code.strip().upper())]
+    else:
+        matches = index.prefix(psc_code or "")
+
+    return {
+        "total_count": len(matches),
+        "psc_codes": [
+            {"psc_code": index.rows[c].get("psc_code"), "description": index.rows[c].get("description")}
+            for c in matches[:page_size]
+        ],
+    }
+
+
+class AgencyTree:
+    """Agency hierarchy keyed by agency_key, with parent/child links and a name index."""
+
+    def __init__(self, rows: list[dict]):
+        self.agencies: dict[int, dict] = {}
+        self.parents: dict[int, int] = {}
+        self.children: dict[int, list[int]] = {}
+        for row in rows:
+            if row.get("agency_key") is not None:
+                self.agencies[int(row["agency_key"])] = row
+        by_name = {(a.get("agency_name") or "").lower(): key for key, a in self.agencies.items()}
+        for key, a in self.agencies.items():
+            parent = a.get("parent_agency")
+            if isinstance(parent, dict):
+                parent_key = parent.get("agency_key")
+                if parent_key is None:
+                    parent_key = by_name.get((parent.get("agency_name") or "").lower())
+            else:
+                parent_key = by_name.get((parent or "").lower())
+            if parent_key is not None and int(parent_key) != key:
+                self.parents[key] = int(parent_key)
+                self.children.setdefault(int(parent_key), []).append(key)
+        self._names = CodeIndex(
+            [
+                {"key": key, "text": f"{a.get('agency_name') or ''} {a.get('agency_abbreviation') or ''}"}
+                for key, a in self.agencies.items()
+            ],
+            "key",
+            "text",
+        )
+
+    def ancestors(self, key: int) -> list[int]:
+        """Return parent, grandparent, ... up to the top-level agency."""
+        chain = []
+        while key in self.parents and self.parents[key] not in chain:
+            key = self.parents[key]
+            chain.append(key)
+        return chain
+
+    def descendants(self, key: int) -> list[int]:
+        """Return every agency below `key`, breadth first."""
+        found = []
+        seen = {key}
+        queue = deque(self.children.get(key, []))
+        while queue:
+            child = queue.popleft()
+            if child in seen:
+                continue
+            seen.add(child)
+            found.append(child)
+            queue.extend(self.children.get(child, []))
+        return found
+
+    def search(self, name: str) -> list[int]:
+        """Return agency keys whose name or abbreviation matches, best first."""
+        return [int(k) for k in self._names.rank(name)]
+
+    def summary(self, key: int) -> dict:
+        a = self.agencies[key]
+        return {
+            "agency_key": key,
+            "name": a.get("agency_name"),
+            "abbreviation": a.get("agency_abbreviation"),
+            "agency_type": a.get("agency_type"),
+            "parent_agency_key": self.parents.get(key),
+            "child_count": len(self.children.get(key, [])),
+        }
+
+
+agency_tree: AgencyTree | None = None
+_agency_tree_built = 0.0
+_agency_tree_lock = asyncio.Lock()
+
+
+def agency_tree_stale() -> bool:
+    return agency_tree is None or time.monotonic() - _agency_tree_built >= AGENCY_REFRESH_INTERVAL
+
+
+async def get_agency_tree() -> AgencyTree:
+    """
+    Return the agency hierarchy, building it on first use and rebuilding it on the
+    first use after AGENCY_REFRESH_INTERVAL. A failed rebuild keeps serving the old tree.
+    """
+    global agency_tree, _agency_tree_built
+    if agency_tree_stale():
+        async with _agency_tree_lock:
+            if agency_tree_stale():
+                try:
+                    agency_tree = AgencyTree(await load_reference_rows("agency", AGENCY_REFRESH_INTERVAL))
+                except (httpx.HTTPError, OSError, QuotaExceededError):
+                    if agency_tree is None:
+                        raise
+                _agency_tree_built = time.monotonic()
+    return agency_tree
+
+
+async def expand_agency_keys(agency_key: int) -> list[int]:
+    """Return `agency_key` followed by the keys of all its sub-agencies."""
+    tree = await get_agency_tree()
+    return [agency_key, *tree.descendants(agency_key)]
+
+
+@mcp.tool
+async def find_agencies(
+    name: str,
+    page_size: int = 25,
+    fields: list[str] | None = None,
+) -> dict:
+    """
+    Find federal agencies by name or abbreviation (e.g. "Defense", "DHS", "army corps").
+    Served from an in-memory agency hierarchy, built from one download of the agency
+    table on first use (3K+ records of quota, once per refresh interval).
+
+    Args:
+        name: Agency name words or abbreviation
+        page_size: Maximum number of matches
+        fields: Only return these fields of each agency (e.g. ["agency_key", "name", "parents"])
+
+    Returns:
+        Matching agencies, best first, each with its parent chain
+    """
+    tree = await get_agency_tree()
+    matches = tree.search(name)
+    agencies = []
+    for key in matches[:page_size]:
+        agencies.append(select_fields({
+            **tree.summary(key),
+            "parents": [tree.agencies[k].get("agency_name") for k in tree.ancestors(key)],
+        }, fields))
+    return {"total_count": len(matches), "agencies": agencies}
+
+
+@mcp.tool
+async def get_agency_hierarchy(
+    agency_key: int,
+    max_descendants: int = 200,
+    fields: list[str] | None = None,
+) -> dict:
+    """
+    Get an agency's place in the federal hierarchy: ancestors, direct children,
+    and the agency_keys of every sub-agency beneath it.
+
+    Use descendant_keys to fan out searches that filter by a single agency key;
+    search_contracts(awarding_agency_key=..., include_subagencies=True) does this itself.
+
+    Args:
+        agency_key: HigherGov agency key
+        max_descendants: Maximum number of descendant details to list (keys are always complete)
+        fields: Only return these fields of each agency summary (e.g. ["agency_key", "name"])
+
+    Returns:
+        Agency summary, ancestor chain, children, descendants and all descendant keys
+    """
+    tree = await get_agency_tree()
+    if agency_key not in tree.agencies:
+        return {"error": "Agency not found", "agency": None}
+    descendants = tree.descendants(agency_key)
+
+    def summary(key: int) -> dict:
+        return select_fields(tree.summary(key), fields)
+
+    return {
+        "agency": summary(agency_key),
+        "ancestors": [summary(k) for k in tree.ancestors(agency_key)],
+        "children": [summary(k) for k in tree.children.get(agency_key, [])],
+        "descendant_count": len(descendants),
+        "descendants": [summary(k) for k in descendants[:max_descendants]],
+        "descendant_keys": descendants,
+    }
+
+
+@mcp.tool
+async def get_rate_limit_status() -> dict:
+    """
+    Show how close the server is to HigherGov's request rate limits.
+
+    Returns:
+        Available tokens per bucket (per-second and per-day) and queued callers
+    """
+    return rate_limiter.status()
+
+
+@mcp.tool
+async def get_cache_stats() -> dict:
+    """
+    Show response cache usage: entries, size, hit/miss counters and per-endpoint TTLs.
+
+    Returns:
+        Cache statistics, number of requests coalesced onto an identical in-flight
+        request, TTL (seconds) configured for each endpoint, and on-disk cache
+        statistics when the disk cache is enabled
+    """
+    stats = {
+        **response_cache.stats(),
+        "coalesced": coalesced_requests,
+        "in_flight": len(_inflight),
+        "ttl_seconds": CACHE_TTLS,
+    }
+    if disk_cache is not None:
+        stats["disk"] = await asyncio.to_thread(disk_cache.stats)
+    return stats
+
+
+@mcp.tool
+async def get_record_usage(month: str | None = None) -> dict:
+    """
+    Show HigherGov records consumed against the monthly subscription quota.
+    Only records fetched from the API count; cached responses are free.
+
+    Args:
+        month: Month to report (YYYY-MM, default current month)
+
+    Returns:
+        Total records and requests, broken down by endpoint and by MCP client/session,
+        plus the configured budgets
+    """
+    usage = await asyncio.to_thread(quota.usage, month)
+    if quota.monthly_budget and usage["month"] == quota.current_month():
+        usage["monthly_remaining"] = max(0, quota.monthly_budget - usage["total_records"])
+    return usage
+
+
+@mcp.tool
+async def sync_opportunities_now() -> dict:
+    """
+    Run one incremental sync of the local opportunity store (new captured_date
+    deltas since the last sync). Normally this runs in the background.
 
-    return {"psc_codes": codes}
+    Returns:
+        Requests made, opportunities fetched and newly added, and the new high-water date
+    """
+    return await sync_opportunities()
+
+
+@mcp.tool
+async def get_opportunity_sync_status() -> dict:
+    """
+    Show the state of the local opportunity store used by search_opportunities(local=True).
+
+    Returns:
+        Stored opportunity count, newest captured_date, high-water mark and last sync time
+    """
+    status = await asyncio.to_thread(opportunity_store.stats)
+    status["background_sync_interval"] = OPPORTUNITY_SYNC_INTERVAL or None
+    return status
+
+
+MIRRORS = {
+    "contracts": (contract_mirror, "contract", CONTRACT_MIRROR_SCOPES, contract_row),
+    "grants": (
+        grant_mirror,
+        "grant",
+        [("cfda_program_number", number) for number in GRANT_MIRROR_CFDA_PROGRAMS],
+        grant_row,
+    ),
+    "awardees": (awardee_registry, "awardee", AWARDEE_MIRROR_SCOPES, awardee_row),
+}
+
+
+async def run_mirror_sync() -> None:
+    """Sync every configured mirror each MIRROR_SYNC_INTERVAL seconds."""
+    while True:
+        for mirror, endpoint, scopes, row in MIRRORS.values():
+            if scopes:
+                try:
+                    await sync_mirror(mirror, endpoint, scopes, row)
+                except (httpx.HTTPError, ToolError, sqlite3.Error):
+                    pass
+        await asyncio.sleep(MIRROR_SYNC_INTERVAL)
+
+
+@mcp.tool
+async def sync_mirrors_now(name: str | None = None) -> dict:
+    """
+    Run one incremental sync of the local mirrors (records modified since the
+    last sync, for each configured scope). Normally this runs in the background.
+
+    Args:
+        name: Mirror to sync (e.g. "contracts"); all configured mirrors if omitted
+
+    Returns:
+        Records written per mirror, and any days cut off by the per-day record cap
+    """
+    if name is not None and name not in MIRRORS:
+        return {"error": f"Unknown mirror: {name}", "mirrors": list(MIRRORS)}
+    results = {}
+    for mirror_name, (mirror, endpoint, scopes, row) in MIRRORS.items():
+        if name in (None, mirror_name):
+            results[mirror_name] = (
+                await sync_mirror(mirror, endpoint, scopes, row) if scopes else {"error": "No scopes configured"}
+            )
+    return results
+
+
+@mcp.tool
+async def get_mirror_status() -> dict:
+    """
+    Show the local mirrors used by local=True searches and awardee name lookups: record counts,
+    configured scopes, the high-water day synced for each scope, and days only partly
+    synced because they exceeded HIGHER_GOV_MIRROR_MAX_RECORDS_PER_DAY.
+
+    Returns:
+        Status per mirror
+    """
+    status = {}
+    for name, (mirror, _, scopes, _) in MIRRORS.items():
+        status[name] = {
+            **await asyncio.to_thread(mirror.stats),
+            "scopes": [f"{field}={value}" if field else "all" for field, value in scopes],
+        }
+    status["background_sync_interval"] = MIRROR_SYNC_INTERVAL or None
+    return status